@@ -6,13 +6,37 @@ Identifies satisfaction drivers and pain points for each bank
 import pandas as pd
 import numpy as np
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+import os
 import re
 
 
-def load_data():
-    """Load analyzed reviews and theme data."""
+def load_data(bank=None):
+    """Load analyzed reviews and theme data.
+
+    Prefers the bank-partitioned Parquet dataset, then the flat Parquet
+    copy written by the analysis pipeline (typed columns, no CSV
+    re-parsing), and finally falls back to the CSV.
+
+    Args:
+        bank: Optional bank name; with the partitioned dataset only that
+            bank's partition is read
+    """
     try:
-        df_reviews = pd.read_csv("data/processed/reviews_analyzed.csv")
+        dataset_dir = "data/processed/analytics"
+        parquet_file = "data/processed/reviews_analyzed.parquet"
+        if os.path.isdir(dataset_dir):
+            df_reviews = pd.read_parquet(
+                dataset_dir, engine='pyarrow',
+                filters=[('bank', '==', bank)] if bank else None
+            )
+        elif os.path.exists(parquet_file):
+            df_reviews = pd.read_parquet(parquet_file, engine='pyarrow')
+        else:
+            try:
+                df_reviews = pd.read_csv("data/processed/reviews_analyzed.csv", engine='pyarrow')
+            except (ImportError, ValueError):
+                df_reviews = pd.read_csv("data/processed/reviews_analyzed.csv")
         df_themes = pd.read_csv("data/processed/theme_summary.csv")
         return df_reviews, df_themes
     except FileNotFoundError as e:
@@ -20,69 +44,141 @@ def load_data():
         return None, None
 
 
+# Compiled once; extract_keywords_from_reviews is called several times per bank
+_WORD_RE = re.compile(r'\b[a-z]{3,}\b')
+_STOPWORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have',
+    'has', 'had', 'do', 'does', 'did', 'will', 'would', 'should', 'could',
+    'this', 'that', 'these', 'those', 'it', 'its', 'they', 'them', 'we',
+    'app', 'bank', 'banking', 'mobile', 'application'
+})
+
+# Trigger-word patterns compiled once instead of per str.contains call
+_RELIABLE_RE = re.compile(r'reliable|stable|consistent', re.IGNORECASE)
+_SLOW_RE = re.compile(r'slow|delay|timeout|wait', re.IGNORECASE)
+
+# Memoizes keyword counts per (bank, filters) so repeated calls don't
+# rescan the same reviews. The cache is scoped to one frame at a time:
+# the entry points that bind a fresh DataFrame (generate_insights_report
+# and the _analyze_bank worker) clear it, so entries can never leak
+# between datasets the way an id(df)-based key could after the old
+# frame is garbage-collected and its id reused
+_keyword_cache = {}
+
+
 def extract_keywords_from_reviews(df, bank_name, sentiment_filter=None, rating_filter=None):
     """
     Extract keywords from reviews for a specific bank.
-    
+
     Args:
         df: Reviews dataframe
         bank_name: Name of the bank
         sentiment_filter: 'positive' or 'negative' or None
         rating_filter: List of ratings [1,2,3,4,5] or None
     """
-    bank_df = df[df['bank'] == bank_name].copy()
-    
+    cache_key = (bank_name, sentiment_filter,
+                 tuple(rating_filter) if rating_filter else None)
+    if cache_key in _keyword_cache:
+        return _keyword_cache[cache_key]
+
+    bank_df = df[df['bank'] == bank_name]
+
     if sentiment_filter:
         bank_df = bank_df[bank_df['sentiment_label'] == sentiment_filter]
-    
+
     if rating_filter:
         bank_df = bank_df[bank_df['rating'].isin(rating_filter)]
-    
-    # Extract keywords from review text
-    keywords = []
-    common_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
-                   'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 
-                   'has', 'had', 'do', 'does', 'did', 'will', 'would', 'should', 'could',
-                   'this', 'that', 'these', 'those', 'it', 'its', 'they', 'them', 'we',
-                   'app', 'bank', 'banking', 'mobile', 'application'}
-    
-    for review in bank_df['review_text'].dropna():
-        # Simple keyword extraction
-        words = re.findall(r'\b[a-z]{3,}\b', review.lower())
-        keywords.extend([w for w in words if w not in common_words])
-    
-    return Counter(keywords)
 
+    # Extract keywords from all reviews in one regex pass. Tokenization and
+    # counting both run in C (re.findall + Counter); a JIT-compiled counting
+    # kernel only starts to pay off well beyond ~100k reviews per bank.
+    text = '\n'.join(bank_df['review_text'].dropna().str.lower())
+    keywords = Counter(w for w in _WORD_RE.findall(text) if w not in _STOPWORDS)
+
+    _keyword_cache[cache_key] = keywords
+    return keywords
+
+
+def build_theme_counts(df):
+    """
+    Count theme occurrences per bank for positive and negative reviews.
+
+    A single explode + groupby pass replaces the per-bank Python counting
+    loops that used to run inside identify_drivers/identify_pain_points.
 
-def identify_drivers(df, bank_name):
+    Args:
+        df: Reviews dataframe
+
+    Returns:
+        Tuple of (positive_counts, negative_counts), each a Series
+        indexed by (bank, theme)
+    """
+    themes_long = df.assign(theme=df['identified_themes'].str.split('; ')).explode('theme')
+    themes_long = themes_long[themes_long['theme'].notna() & (themes_long['theme'] != '')]
+
+    positive_mask = (themes_long['rating'] >= 4) | (themes_long['sentiment_label'] == 'positive')
+    negative_mask = (themes_long['rating'] <= 2) | (themes_long['sentiment_label'] == 'negative')
+
+    # observed=True: with a categorical bank column (parquet round-trips)
+    # the default would emit the full bank x theme cartesian product,
+    # injecting zero-count entries that pass the membership guards in
+    # identify_drivers/identify_pain_points
+    positive_counts = themes_long[positive_mask].groupby(
+        ['bank', 'theme'], observed=True).size()
+    negative_counts = themes_long[negative_mask].groupby(
+        ['bank', 'theme'], observed=True).size()
+
+    return positive_counts, negative_counts
+
+
+def _bank_theme_counts(counts, bank_name):
+    """Slice per-bank theme counts out of a (bank, theme)-indexed Series."""
+    if bank_name in counts.index.get_level_values(0):
+        return counts.loc[bank_name].to_dict()
+    return {}
+
+
+def _theme_prefix_count(theme_counts, prefix):
+    """
+    Total mentions across themes whose name starts with a prefix.
+
+    Themes are assigned at most once per review, so this equals the number
+    of reviews mentioning the theme — without rescanning the frame with
+    str.contains for every theme.
+    """
+    return sum(count for theme, count in theme_counts.items() if theme.startswith(prefix))
+
+
+def identify_drivers(df, bank_name, theme_counts=None):
     """
     Identify satisfaction drivers (positive aspects) for a bank.
-    
+
     Args:
         df: Reviews dataframe
         bank_name: Name of the bank
-    
+        theme_counts: Optional precomputed theme counts for this bank's
+            positive reviews (from build_theme_counts)
+
     Returns:
         List of drivers with evidence
     """
     # Filter positive reviews (4-5 stars or positive sentiment)
     positive_reviews = df[
-        (df['bank'] == bank_name) & 
+        (df['bank'] == bank_name) &
         ((df['rating'] >= 4) | (df['sentiment_label'] == 'positive'))
     ]
-    
+
     if len(positive_reviews) == 0:
         return []
-    
+
     drivers = []
-    
+
     # Analyze themes in positive reviews
-    theme_counts = {}
-    for themes in positive_reviews['identified_themes'].dropna():
-        if themes:
-            for theme in themes.split('; '):
-                theme_counts[theme] = theme_counts.get(theme, 0) + 1
-    
+    if theme_counts is None:
+        positive_counts, _ = build_theme_counts(df)
+        theme_counts = _bank_theme_counts(positive_counts, bank_name)
+
     # Extract keywords from positive reviews
     positive_keywords = extract_keywords_from_reviews(df, bank_name, sentiment_filter='positive', rating_filter=[4, 5])
     
@@ -96,7 +192,7 @@ def identify_drivers(df, bank_name):
                 'driver': 'User-Friendly Interface',
                 'evidence': f"Mentioned in {theme_counts['User Interface & Experience']} positive reviews",
                 'keywords': ', '.join(ui_keywords[:5]),
-                'sample_reviews': len(positive_reviews[positive_reviews['identified_themes'].str.contains('User Interface', na=False)])
+                'sample_reviews': _theme_prefix_count(theme_counts, 'User Interface')
             })
     
     # Driver 2: Transaction Performance
@@ -108,7 +204,7 @@ def identify_drivers(df, bank_name):
                 'driver': 'Fast Transaction Processing',
                 'evidence': f"Mentioned in {theme_counts['Transaction Performance']} positive reviews",
                 'keywords': ', '.join(perf_keywords[:5]),
-                'sample_reviews': len(positive_reviews[positive_reviews['identified_themes'].str.contains('Transaction Performance', na=False)])
+                'sample_reviews': _theme_prefix_count(theme_counts, 'Transaction Performance')
             })
     
     # Driver 3: Security & Privacy
@@ -117,11 +213,11 @@ def identify_drivers(df, bank_name):
             'driver': 'Security Features',
             'evidence': f"Mentioned in {theme_counts['Security & Privacy']} positive reviews",
             'keywords': 'security, safe, secure',
-            'sample_reviews': len(positive_reviews[positive_reviews['identified_themes'].str.contains('Security', na=False)])
+            'sample_reviews': _theme_prefix_count(theme_counts, 'Security')
         })
     
     # Driver 4: Reliability (if mentioned positively)
-    reliable_count = len(positive_reviews[positive_reviews['review_text'].str.contains('reliable|stable|consistent', case=False, na=False)])
+    reliable_count = int(positive_reviews['review_text'].str.contains(_RELIABLE_RE, na=False).sum())
     if reliable_count > 5:
         drivers.append({
             'driver': 'App Reliability',
@@ -133,35 +229,35 @@ def identify_drivers(df, bank_name):
     return drivers[:3]  # Return top 3 drivers
 
 
-def identify_pain_points(df, bank_name):
+def identify_pain_points(df, bank_name, theme_counts=None):
     """
     Identify pain points (negative aspects) for a bank.
-    
+
     Args:
         df: Reviews dataframe
         bank_name: Name of the bank
-    
+        theme_counts: Optional precomputed theme counts for this bank's
+            negative reviews (from build_theme_counts)
+
     Returns:
         List of pain points with evidence
     """
     # Filter negative reviews (1-2 stars or negative sentiment)
     negative_reviews = df[
-        (df['bank'] == bank_name) & 
+        (df['bank'] == bank_name) &
         ((df['rating'] <= 2) | (df['sentiment_label'] == 'negative'))
     ]
-    
+
     if len(negative_reviews) == 0:
         return []
-    
+
     pain_points = []
-    
+
     # Analyze themes in negative reviews
-    theme_counts = {}
-    for themes in negative_reviews['identified_themes'].dropna():
-        if themes:
-            for theme in themes.split('; '):
-                theme_counts[theme] = theme_counts.get(theme, 0) + 1
-    
+    if theme_counts is None:
+        _, negative_counts = build_theme_counts(df)
+        theme_counts = _bank_theme_counts(negative_counts, bank_name)
+
     # Extract keywords from negative reviews
     negative_keywords = extract_keywords_from_reviews(df, bank_name, sentiment_filter='negative', rating_filter=[1, 2])
     
@@ -174,7 +270,7 @@ def identify_pain_points(df, bank_name):
                 'pain_point': 'App Crashes and Bugs',
                 'evidence': f"Mentioned in {theme_counts['App Reliability & Bugs']} negative reviews",
                 'keywords': ', '.join(bug_keywords[:5]),
-                'sample_reviews': len(negative_reviews[negative_reviews['identified_themes'].str.contains('App Reliability', na=False)]),
+                'sample_reviews': _theme_prefix_count(theme_counts, 'App Reliability'),
                 'severity': 'High' if theme_counts['App Reliability & Bugs'] > 50 else 'Medium'
             })
     
@@ -187,13 +283,13 @@ def identify_pain_points(df, bank_name):
                 'pain_point': 'Login and Access Problems',
                 'evidence': f"Mentioned in {theme_counts['Account Access Issues']} negative reviews",
                 'keywords': ', '.join(access_keywords[:5]),
-                'sample_reviews': len(negative_reviews[negative_reviews['identified_themes'].str.contains('Account Access', na=False)]),
+                'sample_reviews': _theme_prefix_count(theme_counts, 'Account Access'),
                 'severity': 'High' if theme_counts['Account Access Issues'] > 50 else 'Medium'
             })
     
     # Pain Point 3: Transaction Performance (slow)
     if 'Transaction Performance' in theme_counts:
-        slow_count = len(negative_reviews[negative_reviews['review_text'].str.contains('slow|delay|timeout|wait', case=False, na=False)])
+        slow_count = int(negative_reviews['review_text'].str.contains(_SLOW_RE, na=False).sum())
         if slow_count > 10:
             pain_points.append({
                 'pain_point': 'Slow Transaction Processing',
@@ -209,7 +305,7 @@ def identify_pain_points(df, bank_name):
             'pain_point': 'Customer Support Issues',
             'evidence': f"Mentioned in {theme_counts['Customer Support']} negative reviews",
             'keywords': 'support, service, branch, help',
-            'sample_reviews': len(negative_reviews[negative_reviews['identified_themes'].str.contains('Customer Support', na=False)]),
+            'sample_reviews': _theme_prefix_count(theme_counts, 'Customer Support'),
             'severity': 'Medium'
         })
     
@@ -217,23 +313,44 @@ def identify_pain_points(df, bank_name):
 
 
 def compare_banks(df):
-    """Compare banks across key metrics."""
-    comparison = []
-    
-    for bank in df['bank'].unique():
-        bank_df = df[df['bank'] == bank]
-        
-        comparison.append({
-            'bank': bank,
-            'total_reviews': len(bank_df),
-            'avg_rating': bank_df['rating'].mean(),
-            'positive_sentiment_pct': (bank_df['sentiment_label'] == 'positive').sum() / len(bank_df) * 100,
-            'negative_sentiment_pct': (bank_df['sentiment_label'] == 'negative').sum() / len(bank_df) * 100,
-            '5_star_pct': (bank_df['rating'] == 5).sum() / len(bank_df) * 100,
-            '1_star_pct': (bank_df['rating'] == 1).sum() / len(bank_df) * 100,
-        })
-    
-    return pd.DataFrame(comparison)
+    """Compare banks across key metrics in a single groupby pass."""
+    tmp = df.assign(
+        is_pos=(df['sentiment_label'] == 'positive').astype('int8'),
+        is_neg=(df['sentiment_label'] == 'negative').astype('int8'),
+        is_5=(df['rating'] == 5).astype('int8'),
+        is_1=(df['rating'] == 1).astype('int8'),
+    )
+    comparison = tmp.groupby('bank', observed=True, sort=False).agg(
+        total_reviews=('rating', 'size'),
+        avg_rating=('rating', 'mean'),
+        positive_sentiment_pct=('is_pos', 'mean'),
+        negative_sentiment_pct=('is_neg', 'mean'),
+        **{'5_star_pct': ('is_5', 'mean'), '1_star_pct': ('is_1', 'mean')}
+    )
+    pct_cols = ['positive_sentiment_pct', 'negative_sentiment_pct', '5_star_pct', '1_star_pct']
+    comparison[pct_cols] = comparison[pct_cols] * 100
+
+    return comparison.reset_index()
+
+
+def _analyze_bank(bank, df_slice, positive_theme_counts, negative_theme_counts):
+    """
+    Worker: compute drivers and pain points for one bank's reviews.
+
+    Args:
+        bank: Name of the bank
+        df_slice: Reviews dataframe filtered to this bank
+        positive_theme_counts: Precomputed theme counts for positive reviews
+        negative_theme_counts: Precomputed theme counts for negative reviews
+
+    Returns:
+        Tuple of (bank, drivers, pain_points)
+    """
+    # Fresh frame, fresh cache: worker processes are reused across banks
+    _keyword_cache.clear()
+    drivers = identify_drivers(df_slice, bank, theme_counts=positive_theme_counts)
+    pain_points = identify_pain_points(df_slice, bank, theme_counts=negative_theme_counts)
+    return bank, drivers, pain_points
 
 
 def generate_insights_report():
@@ -246,21 +363,37 @@ def generate_insights_report():
     if df_reviews is None:
         return None
     
-    insights = {}
+    # New dataset for this run; drop any keyword counts from a previous one
+    _keyword_cache.clear()
     
-    for bank in df_reviews['bank'].unique():
+    insights = {}
+
+    # Count themes for all banks in one pass instead of per-bank loops
+    positive_counts, negative_counts = build_theme_counts(df_reviews)
+
+    # Each bank's analysis is independent, so dispatch them to worker
+    # processes; slices are small, so pickling cost is negligible.
+    # groupby().indices locates every bank's rows in one pass instead of
+    # a boolean-mask scan per bank.
+    bank_idx = df_reviews.groupby('bank', observed=True, sort=False).indices
+    banks = list(bank_idx)
+    bank_slices = [df_reviews.iloc[bank_idx[bank]] for bank in banks]
+    pos_dicts = [_bank_theme_counts(positive_counts, bank) for bank in banks]
+    neg_dicts = [_bank_theme_counts(negative_counts, bank) for bank in banks]
+
+    with ProcessPoolExecutor(max_workers=min(len(banks), os.cpu_count() or 1)) as executor:
+        results = list(executor.map(_analyze_bank, banks, bank_slices, pos_dicts, neg_dicts))
+
+    for bank, drivers, pain_points in results:
         print(f"\n{'='*70}")
         print(f"Analyzing: {bank}")
         print(f"{'='*70}")
-        
-        drivers = identify_drivers(df_reviews, bank)
-        pain_points = identify_pain_points(df_reviews, bank)
-        
+
         insights[bank] = {
             'drivers': drivers,
             'pain_points': pain_points
         }
-        
+
         print(f"\n[DRIVERS] ({len(drivers)} identified):")
         for i, driver in enumerate(drivers, 1):
             print(f"\n  {i}. {driver['driver']}")
@@ -282,27 +415,30 @@ def generate_insights_report():
     comparison = compare_banks(df_reviews)
     print(comparison.to_string(index=False))
     
-    # Save insights to CSV
-    insights_data = []
+    # Save insights to CSV; build columns directly so pandas doesn't have
+    # to re-infer dtypes from a list of row dicts
+    bank_col, type_col, item_col, evidence_col, keywords_col = [], [], [], [], []
     for bank, data in insights.items():
         for driver in data['drivers']:
-            insights_data.append({
-                'bank': bank,
-                'type': 'Driver',
-                'item': driver['driver'],
-                'evidence': driver['evidence'],
-                'keywords': driver['keywords']
-            })
+            bank_col.append(bank)
+            type_col.append('Driver')
+            item_col.append(driver['driver'])
+            evidence_col.append(driver['evidence'])
+            keywords_col.append(driver['keywords'])
         for pp in data['pain_points']:
-            insights_data.append({
-                'bank': bank,
-                'type': 'Pain Point',
-                'item': pp['pain_point'],
-                'evidence': pp['evidence'],
-                'keywords': pp['keywords']
-            })
-    
-    insights_df = pd.DataFrame(insights_data)
+            bank_col.append(bank)
+            type_col.append('Pain Point')
+            item_col.append(pp['pain_point'])
+            evidence_col.append(pp['evidence'])
+            keywords_col.append(pp['keywords'])
+
+    insights_df = pd.DataFrame({
+        'bank': bank_col,
+        'type': pd.Categorical(type_col, categories=['Driver', 'Pain Point']),
+        'item': item_col,
+        'evidence': evidence_col,
+        'keywords': keywords_col
+    })
     insights_df.to_csv("data/processed/insights_summary.csv", index=False)
     print(f"\n[OK] Insights saved to data/processed/insights_summary.csv")
     
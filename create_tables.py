@@ -2,24 +2,37 @@
 Simple script to create tables directly
 """
 
+import io
+
 import psycopg2
+from psycopg2 import pool
 from dotenv import load_dotenv
 import os
 
 load_dotenv()
 
-conn = psycopg2.connect(
-    host=os.getenv('DB_HOST', 'localhost'),
-    port=os.getenv('DB_PORT', '5432'),
-    user=os.getenv('DB_USER', 'postgres'),
-    password=os.getenv('DB_PASSWORD', 'postgres'),
-    database='bank_reviews'
-)
+# Shared, lazily created pool so importing scripts reuse connections
+# instead of paying connection setup per invocation
+_POOL = None
+
 
-cur = conn.cursor()
+def _get_pool():
+    """Lazily create the shared connection pool."""
+    global _POOL
+    if _POOL is None:
+        _POOL = pool.SimpleConnectionPool(
+            1, 10,
+            host=os.getenv('DB_HOST', 'localhost'),
+            port=os.getenv('DB_PORT', '5432'),
+            user=os.getenv('DB_USER', 'postgres'),
+            password=os.getenv('DB_PASSWORD', 'postgres'),
+            database='bank_reviews'
+        )
+    return _POOL
 
-# Create banks table
-cur.execute("""
+# All DDL in one statement string so table and index creation is a single
+# round-trip to the server
+DDL = """
 CREATE TABLE IF NOT EXISTS banks (
     bank_id SERIAL PRIMARY KEY,
     bank_name VARCHAR(255) NOT NULL UNIQUE,
@@ -27,10 +40,7 @@ CREATE TABLE IF NOT EXISTS banks (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
-""")
 
-# Create reviews table
-cur.execute("""
 CREATE TABLE IF NOT EXISTS reviews (
     review_id SERIAL PRIMARY KEY,
     bank_id INTEGER NOT NULL,
@@ -40,20 +50,79 @@ CREATE TABLE IF NOT EXISTS reviews (
     sentiment_label VARCHAR(20),
     sentiment_score DECIMAL(5, 4),
     source VARCHAR(100) DEFAULT 'Google Play Store',
+    review_hash BYTEA,
+    themes TEXT,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (bank_id) REFERENCES banks(bank_id) ON DELETE CASCADE
 );
-""")
 
-# Create indexes
-cur.execute("CREATE INDEX IF NOT EXISTS idx_reviews_bank_id ON reviews(bank_id);")
-cur.execute("CREATE INDEX IF NOT EXISTS idx_reviews_rating ON reviews(rating);")
-cur.execute("CREATE INDEX IF NOT EXISTS idx_reviews_date ON reviews(review_date);")
-cur.execute("CREATE INDEX IF NOT EXISTS idx_reviews_sentiment ON reviews(sentiment_label);")
+-- Bring pre-existing databases up to date with the newer columns
+ALTER TABLE reviews ADD COLUMN IF NOT EXISTS review_hash BYTEA;
+ALTER TABLE reviews ADD COLUMN IF NOT EXISTS themes TEXT;
+
+-- Composite covering index matches the analytics filter pattern
+-- (bank AND sentiment/rating) and serves sentiment_score from the index;
+-- the old single-column indexes it replaces only add write amplification
+DROP INDEX IF EXISTS idx_reviews_bank_id;
+DROP INDEX IF EXISTS idx_reviews_sentiment;
+DROP INDEX IF EXISTS idx_reviews_date;
+CREATE INDEX IF NOT EXISTS idx_reviews_bank_sent_rating
+    ON reviews(bank_id, sentiment_label, rating) INCLUDE (sentiment_score);
+CREATE INDEX IF NOT EXISTS idx_reviews_rating ON reviews(rating);
+
+-- Unique content hash per review; the load path relies on it for
+-- INSERT ... ON CONFLICT (review_hash) DO NOTHING
+CREATE UNIQUE INDEX IF NOT EXISTS idx_reviews_hash ON reviews(review_hash);
+
+-- review_date is appended roughly in order, so a BRIN index covers
+-- time-range queries at a fraction of a btree's size
+CREATE INDEX IF NOT EXISTS idx_reviews_date_brin
+    ON reviews USING BRIN(review_date) WITH (pages_per_range=32);
+"""
+
+
+def copy_reviews_from_df(cur, df):
+    """
+    Bulk-load reviews via COPY FROM STDIN (much faster than row-wise INSERT).
+
+    Args:
+        cur: Open psycopg2 cursor
+        df: DataFrame with columns bank_id, review_text, rating,
+            review_date, sentiment_label, sentiment_score, source and
+            review_hash (as \\x-prefixed hex text, bytea input format)
+    """
+    columns = ['bank_id', 'review_text', 'rating', 'review_date',
+               'sentiment_label', 'sentiment_score', 'source',
+               'review_hash']
+    buf = io.StringIO()
+    df[columns].to_csv(buf, index=False, header=False)
+    buf.seek(0)
+    cur.copy_expert(
+        "COPY reviews (bank_id, review_text, rating, review_date, "
+        "sentiment_label, sentiment_score, source, review_hash) "
+        "FROM STDIN WITH CSV",
+        buf
+    )
+
+
+def create_tables():
+    """Create the tables and indexes using a pooled connection."""
+    conn = _get_pool().getconn()
+    try:
+        cur = conn.cursor()
+        cur.execute(DDL)
+        conn.commit()
+        cur.close()
+        print("[OK] Tables created successfully!")
+    finally:
+        _get_pool().putconn(conn)
+
 
-conn.commit()
-print("[OK] Tables created successfully!")
+def main():
+    """Create the tables and indexes."""
+    create_tables()
+    _get_pool().closeall()
 
-cur.close()
-conn.close()
 
+if __name__ == "__main__":
+    main()
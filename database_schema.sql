@@ -31,24 +31,37 @@ CREATE TABLE IF NOT EXISTS reviews (
     sentiment_label VARCHAR(20),
     sentiment_score DECIMAL(5, 4),
     source VARCHAR(100) DEFAULT 'Google Play Store',
+    review_hash BYTEA,
+    themes TEXT,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (bank_id) REFERENCES banks(bank_id) ON DELETE CASCADE
 );
 
+-- Bring pre-existing databases up to date with the hash column
+ALTER TABLE reviews ADD COLUMN IF NOT EXISTS review_hash BYTEA;
+ALTER TABLE reviews ADD COLUMN IF NOT EXISTS themes TEXT;
+
 -- ============================================
 -- INDEXES for Performance
 -- ============================================
--- Index on bank_id for faster joins
-CREATE INDEX IF NOT EXISTS idx_reviews_bank_id ON reviews(bank_id);
+-- For large bulk loads, drop these first and recreate them after the
+-- COPY finishes (see database_setup.drop_indexes / create_indexes)
+-- Composite covering index for the analytics query pattern:
+-- filter by bank AND sentiment/rating, reading sentiment_score
+CREATE INDEX IF NOT EXISTS idx_reviews_bank_sent_rating
+    ON reviews(bank_id, sentiment_label, rating) INCLUDE (sentiment_score);
 
 -- Index on rating for faster filtering
 CREATE INDEX IF NOT EXISTS idx_reviews_rating ON reviews(rating);
 
--- Index on review_date for time-based queries
-CREATE INDEX IF NOT EXISTS idx_reviews_date ON reviews(review_date);
+-- Unique content hash per review; lets repeated loads skip rows that
+-- are already present (INSERT ... ON CONFLICT (review_hash) DO NOTHING)
+CREATE UNIQUE INDEX IF NOT EXISTS idx_reviews_hash ON reviews(review_hash);
 
--- Index on sentiment_label for sentiment analysis queries
-CREATE INDEX IF NOT EXISTS idx_reviews_sentiment ON reviews(sentiment_label);
+-- BRIN index for time-based queries; review_date is appended roughly
+-- in order, so BRIN stays tiny compared to a btree
+CREATE INDEX IF NOT EXISTS idx_reviews_date_brin
+    ON reviews USING BRIN(review_date) WITH (pages_per_range=32);
 
 -- ============================================
 -- COMMENTS for Documentation
@@ -68,4 +81,6 @@ COMMENT ON COLUMN reviews.review_date IS 'Date when the review was posted';
 COMMENT ON COLUMN reviews.sentiment_label IS 'Sentiment classification: positive, negative, or neutral';
 COMMENT ON COLUMN reviews.sentiment_score IS 'Confidence score for sentiment (0.0 to 1.0)';
 COMMENT ON COLUMN reviews.source IS 'Source of the review (e.g., Google Play Store)';
+COMMENT ON COLUMN reviews.review_hash IS 'Content hash of bank_id plus review text, used for idempotent loads';
+COMMENT ON COLUMN reviews.themes IS 'Semicolon-separated themes assigned by thematic analysis';
 
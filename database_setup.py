@@ -1,10 +1,15 @@
 """
 PostgreSQL Database Setup Script
 Creates the database schema and sets up tables for bank reviews
+
+Bulk-load note: populate the reviews table with COPY FROM STDIN
+(cursor.copy_expert over an in-memory CSV buffer), not row-by-row
+INSERTs, and wrap large loads with drop_indexes() / create_indexes()
+so indexes are built once at the end instead of maintained per row.
 """
 
 import psycopg2
-from psycopg2 import sql
+from psycopg2 import pool, sql
 from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
 import os
 from dotenv import load_dotenv
@@ -12,6 +17,25 @@ from dotenv import load_dotenv
 # Load environment variables if .env file exists
 load_dotenv()
 
+# Shared pool for bank_reviews connections; created lazily so importing
+# this module never opens a connection
+_POOL = None
+
+
+def _get_pool():
+    """Lazily create the shared connection pool for bank_reviews."""
+    global _POOL
+    if _POOL is None:
+        _POOL = pool.SimpleConnectionPool(
+            1, 10,
+            host=os.getenv('DB_HOST', 'localhost'),
+            port=os.getenv('DB_PORT', '5432'),
+            user=os.getenv('DB_USER', 'postgres'),
+            password=os.getenv('DB_PASSWORD', 'postgres'),
+            database='bank_reviews'
+        )
+    return _POOL
+
 
 def get_db_connection(create_db=False):
     """
@@ -88,39 +112,86 @@ def create_schema():
         print("[ERROR] Error: database_schema.sql file not found")
         return False
     
-    conn = get_db_connection(create_db=False)
-    if not conn:
+    try:
+        conn = _get_pool().getconn()
+    except psycopg2.Error as e:
+        print(f"Error connecting to database: {e}")
+        print("\nPlease ensure PostgreSQL is installed and running.")
+        print("You may need to set environment variables:")
+        print("  DB_HOST, DB_PORT, DB_USER, DB_PASSWORD")
         return False
-    
+
     try:
         cursor = conn.cursor()
-        
-        # Execute schema SQL
-        # Split by semicolon and execute each statement
-        statements = [s.strip() for s in schema_sql.split(';') if s.strip() and not s.strip().startswith('--')]
-        
-        for statement in statements:
-            if statement:
-                try:
-                    cursor.execute(statement)
-                    conn.commit()  # Commit after each successful statement
-                except psycopg2.Error as e:
-                    # Ignore "already exists" errors
-                    if 'already exists' not in str(e).lower() and 'does not exist' not in str(e).lower():
-                        print(f"  Warning: {e}")
-                    conn.rollback()  # Rollback on error, then continue
-        
+
+        # The schema file is idempotent (IF NOT EXISTS throughout), so the
+        # whole script can run as one round-trip and one transaction
+        cursor.execute(schema_sql)
+        conn.commit()
+
         print("[OK] Database schema created successfully")
-        
+
         cursor.close()
-        conn.close()
         return True
-        
+
     except psycopg2.Error as e:
         print(f"[ERROR] Error creating schema: {e}")
         conn.rollback()
-        conn.close()
         return False
+    finally:
+        _get_pool().putconn(conn)
+
+
+# Secondary indexes on reviews; dropped before a bulk load and rebuilt
+# afterwards so COPY doesn't pay per-row index maintenance
+_REVIEWS_INDEXES = {
+    'idx_reviews_bank_sent_rating':
+        "CREATE INDEX IF NOT EXISTS idx_reviews_bank_sent_rating "
+        "ON reviews(bank_id, sentiment_label, rating) INCLUDE (sentiment_score)",
+    'idx_reviews_rating':
+        "CREATE INDEX IF NOT EXISTS idx_reviews_rating ON reviews(rating)",
+    'idx_reviews_date_brin':
+        "CREATE INDEX IF NOT EXISTS idx_reviews_date_brin "
+        "ON reviews USING BRIN(review_date) WITH (pages_per_range=32)",
+}
+
+
+def drop_indexes():
+    """Drop the secondary reviews indexes ahead of a bulk load."""
+    conn = _get_pool().getconn()
+    try:
+        cursor = conn.cursor()
+        cursor.execute('; '.join(
+            f"DROP INDEX IF EXISTS {name}" for name in _REVIEWS_INDEXES
+        ))
+        conn.commit()
+        cursor.close()
+        print("[OK] Reviews indexes dropped for bulk load")
+        return True
+    except psycopg2.Error as e:
+        print(f"[ERROR] Error dropping indexes: {e}")
+        conn.rollback()
+        return False
+    finally:
+        _get_pool().putconn(conn)
+
+
+def create_indexes():
+    """Rebuild the secondary reviews indexes after a bulk load."""
+    conn = _get_pool().getconn()
+    try:
+        cursor = conn.cursor()
+        cursor.execute('; '.join(_REVIEWS_INDEXES.values()))
+        conn.commit()
+        cursor.close()
+        print("[OK] Reviews indexes created")
+        return True
+    except psycopg2.Error as e:
+        print(f"[ERROR] Error creating indexes: {e}")
+        conn.rollback()
+        return False
+    finally:
+        _get_pool().putconn(conn)
 
 
 def main():
@@ -140,7 +211,10 @@ def main():
     if not create_schema():
         print("[ERROR] Failed to create schema. Exiting.")
         return
-    
+
+    if _POOL is not None:
+        _POOL.closeall()
+
     print("\n" + "=" * 60)
     print("Database setup complete!")
     print("=" * 60)
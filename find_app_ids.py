@@ -3,44 +3,72 @@ Helper script to find Google Play Store app IDs for the three banks.
 This script uses the google-play-scraper library to search for apps.
 """
 
+import functools
+import re
+from concurrent.futures import ThreadPoolExecutor
+
 from google_play_scraper import search
 
-def find_app_id(bank_name, keywords):
+
+@functools.lru_cache(maxsize=None)
+def _cached_search(keyword):
+    """Play Store search memoized per keyword for the process lifetime."""
+    return search(keyword, lang='en', country='us', n_hits=5)
+
+
+def _search_keyword(keyword):
+    """Run one Play Store search, returning (keyword, results)."""
+    try:
+        return keyword, _cached_search(keyword)
+    except Exception as e:
+        print(f"  Error searching for '{keyword}': {str(e)}")
+        return keyword, []
+
+
+def find_app_id(bank_name, keywords, search_results=None):
     """
     Search for app ID by bank name and keywords.
-    
+
     Args:
         bank_name: Name of the bank
         keywords: List of search keywords
+        search_results: Optional dict of keyword -> results fetched in
+            advance; when omitted, searches run here
     """
     print(f"\nSearching for {bank_name} app...")
     print(f"Keywords: {', '.join(keywords)}")
     print("-" * 60)
-    
+
+    if search_results is None:
+        with ThreadPoolExecutor(max_workers=min(8, len(keywords))) as executor:
+            search_results = dict(executor.map(_search_keyword, keywords))
+
+    # One compiled alternation per bank replaces the per-title loop of
+    # Python substring checks
+    name_pattern = re.compile(
+        r'\b(' + '|'.join(map(re.escape, bank_name.lower().split())) + r')\b'
+    )
+
     for keyword in keywords:
-        try:
-            results = search(keyword, lang='en', country='us', n_hits=5)
-            
-            if results:
-                print(f"\nResults for '{keyword}':")
-                for i, app in enumerate(results, 1):
-                    print(f"\n{i}. {app.get('title', 'N/A')}")
-                    print(f"   App ID: {app.get('appId', 'N/A')}")
-                    print(f"   Developer: {app.get('developer', 'N/A')}")
-                    print(f"   Score: {app.get('score', 'N/A')}")
-                    print(f"   Installs: {app.get('installs', 'N/A')}")
-                    
-                # Check if any result matches the bank name
-                for app in results:
-                    title = app.get('title', '').lower()
-                    if any(word in title for word in bank_name.lower().split()):
-                        print(f"\n✓ Potential match found!")
-                        print(f"  App ID: {app.get('appId')}")
-                        return app.get('appId')
-        except Exception as e:
-            print(f"  Error searching for '{keyword}': {str(e)}")
-            continue
-    
+        results = search_results.get(keyword) or []
+
+        if results:
+            print(f"\nResults for '{keyword}':")
+            for i, app in enumerate(results, 1):
+                print(f"\n{i}. {app.get('title', 'N/A')}")
+                print(f"   App ID: {app.get('appId', 'N/A')}")
+                print(f"   Developer: {app.get('developer', 'N/A')}")
+                print(f"   Score: {app.get('score', 'N/A')}")
+                print(f"   Installs: {app.get('installs', 'N/A')}")
+
+            # Check if any result matches the bank name
+            for app in results:
+                title = app.get('title', '').lower()
+                if name_pattern.search(title):
+                    print(f"\n✓ Potential match found!")
+                    print(f"  App ID: {app.get('appId')}")
+                    return app.get('appId')
+
     print("\n⚠ No exact match found. Please manually verify the app ID from Google Play Store.")
     return None
 
@@ -52,7 +80,7 @@ def main():
     print("=" * 60)
     print("\nThis script helps you find the correct app IDs.")
     print("Update the app IDs in scrape_reviews.py after finding them.\n")
-    
+
     banks = {
         "Commercial Bank of Ethiopia": [
             "commercial bank ethiopia",
@@ -73,14 +101,20 @@ def main():
             "dashen bank mobile"
         ]
     }
-    
+
+    # Each search is a blocking HTTP round-trip, so fire all of them at
+    # once and match titles afterwards from the collected results
+    all_keywords = [kw for keywords in banks.values() for kw in keywords]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        search_results = dict(executor.map(_search_keyword, all_keywords))
+
     app_ids = {}
-    
+
     for bank_name, keywords in banks.items():
-        app_id = find_app_id(bank_name, keywords)
+        app_id = find_app_id(bank_name, keywords, search_results)
         if app_id:
             app_ids[bank_name] = app_id
-    
+
     if app_ids:
         print("\n" + "=" * 60)
         print("Recommended App IDs:")
@@ -101,5 +135,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
-
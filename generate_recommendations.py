@@ -3,301 +3,489 @@ Generate Recommendations Report
 Creates actionable recommendations based on insights analysis
 """
 
+import functools
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+
 import pandas as pd
-from analyze_insights import load_data, identify_drivers, identify_pain_points, compare_banks
+from analyze_insights import (load_data, identify_drivers, identify_pain_points,
+                              compare_banks, generate_insights_report)
 from datetime import datetime
 
+_REVIEWS_CSV = "data/processed/reviews_analyzed.csv"
+_INSIGHTS_CACHE = "data/processed/_insights_cache.pkl"
+
+
+def _reviews_cache_key():
+    """Identify the current version of the reviews file by mtime and size."""
+    try:
+        return (os.path.getmtime(_REVIEWS_CSV), os.path.getsize(_REVIEWS_CSV))
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_insights(cache_key):
+    """
+    Insights (and the pre-rendered comparison table) memoized per
+    reviews-file version.
+
+    The insights computation (I/O plus theme extraction) dominates this
+    module's runtime, so results are pickled next to the data keyed on
+    the reviews file's mtime and size. Repeat report runs on unchanged
+    data become a single pickle read; repeat calls in the same process
+    hit the lru_cache directly.
+    """
+    if cache_key is not None and os.path.exists(_INSIGHTS_CACHE):
+        try:
+            with open(_INSIGHTS_CACHE, 'rb') as f:
+                stored_key, insights, comparison, comparison_text = pickle.load(f)
+            if stored_key == cache_key:
+                print("[OK] Loaded cached insights (reviews file unchanged)")
+                return insights, comparison, comparison_text
+        except Exception:
+            pass  # Stale or unreadable cache; recompute below
+
+    insights, comparison = generate_insights_report()
+    # Render the comparison table once; the formatter walks every cell
+    # in Python, so cache hits skip it entirely
+    comparison_text = (comparison.to_string(index=False)
+                       if comparison is not None else None)
+
+    if cache_key is not None and insights is not None:
+        try:
+            with open(_INSIGHTS_CACHE, 'wb') as f:
+                pickle.dump((cache_key, insights, comparison, comparison_text),
+                            f, protocol=5)
+        except Exception:
+            pass  # Cache write failures never block the report
+
+    return insights, comparison, comparison_text
+
+
+# Recommendation templates, built once at import time and frozen
+# (read-only mapping views over tuple details) so every produced
+# recommendation shares the same objects; the rule tables map an
+# insight keyword to its template and are scanned in order with first
+# match winning
+_TPL_STABILITY = MappingProxyType({
+    'priority': 'High',
+    'category': 'Technical',
+    'recommendation': 'Implement comprehensive bug fixing and stability improvements',
+    'details': (
+        'Conduct thorough QA testing before releases',
+        'Implement crash reporting and monitoring',
+        'Prioritize fixing critical bugs affecting core functionality',
+        'Establish a bug triage process'
+    ),
+    'expected_impact': 'Reduce negative reviews by 30-40%'
+})
+
+_TPL_LOGIN = MappingProxyType({
+    'priority': 'High',
+    'category': 'Technical',
+    'recommendation': 'Improve login and authentication system',
+    'details': (
+        'Implement biometric authentication (fingerprint, face ID)',
+        'Add "Remember Me" option for trusted devices',
+        'Improve offline mode functionality',
+        'Optimize connection handling and retry logic'
+    ),
+    'expected_impact': 'Improve user experience and reduce access-related complaints'
+})
+
+_TPL_INTERFACE = MappingProxyType({
+    'priority': 'Medium',
+    'category': 'UX/UI',
+    'recommendation': 'Enhance user interface based on positive feedback',
+    'details': (
+        'Maintain simplicity and ease of use',
+        'Add more customization options',
+        'Improve navigation flow',
+        'Implement dark mode option'
+    ),
+    'expected_impact': 'Increase user satisfaction and retention'
+})
+
+_TPL_TRANSACTIONS = MappingProxyType({
+    'priority': 'Medium',
+    'category': 'Performance',
+    'recommendation': 'Optimize transaction processing speed',
+    'details': (
+        'Implement transaction queuing for better performance',
+        'Add transaction status notifications',
+        'Optimize backend API response times',
+        'Add batch transaction capability'
+    ),
+    'expected_impact': 'Maintain competitive advantage in transaction speed'
+})
+
+_TPL_PERFORMANCE = MappingProxyType({
+    'priority': 'Medium',
+    'category': 'Performance',
+    'recommendation': 'Improve app performance and loading times',
+    'details': (
+        'Optimize app startup time',
+        'Implement lazy loading for non-critical features',
+        'Cache frequently accessed data',
+        'Optimize image and asset sizes'
+    ),
+    'expected_impact': 'Reduce user frustration and improve ratings'
+})
+
+_TPL_SUPPORT = MappingProxyType({
+    'priority': 'Medium',
+    'category': 'Customer Service',
+    'recommendation': 'Enhance customer support within the app',
+    'details': (
+        'Add in-app chat support',
+        'Implement AI chatbot for common queries',
+        'Add FAQ section with search functionality',
+        'Provide video tutorials for common tasks'
+    ),
+    'expected_impact': 'Reduce support tickets and improve user satisfaction'
+})
+
+_TPL_FEATURES = MappingProxyType({
+    'priority': 'Low',
+    'category': 'Features',
+    'recommendation': 'Add requested features based on user feedback',
+    'details': (
+        'Transaction history export (PDF/CSV)',
+        'Budgeting and expense tracking tools',
+        'Multiple account management in single app',
+        'Bill payment reminders and scheduling',
+        'Spending analytics and insights'
+    ),
+    'expected_impact': 'Increase app value proposition and user engagement',
+    'based_on': 'Feature Requests theme analysis'
+})
+
+_TOP_PAIN_RULES = (
+    ('Crashes', _TPL_STABILITY),
+    ('Bugs', _TPL_STABILITY),
+    ('Access', _TPL_LOGIN),
+    ('Login', _TPL_LOGIN),
+)
+
+_DRIVER_RULES = (
+    ('Interface', _TPL_INTERFACE),
+    ('Transaction', _TPL_TRANSACTIONS),
+)
+
+_SECOND_PAIN_RULES = (
+    ('Slow', _TPL_PERFORMANCE),
+    ('Support', _TPL_SUPPORT),
+)
+
+
+def _match_rule(rules, label):
+    """Return a recommendation from the first rule whose keyword is in label."""
+    for keyword, template in rules:
+        if keyword in label:
+            return {**template, 'based_on': label}
+    return None
+
+
+def _recs_for_bank(bank, data):
+    """Build the recommendation list for one bank."""
+    bank_recommendations = []
+
+    drivers = data['drivers']
+    pain_points = data['pain_points']
+
+    # Recommendation 1: Address top pain point
+    if pain_points:
+        rec = _match_rule(_TOP_PAIN_RULES, pain_points[0]['pain_point'])
+        if rec:
+            bank_recommendations.append(rec)
+
+    # Recommendation 2: Enhance top driver
+    if drivers:
+        rec = _match_rule(_DRIVER_RULES, drivers[0]['driver'])
+        if rec:
+            bank_recommendations.append(rec)
+
+    # Recommendation 3: Address second pain point
+    if len(pain_points) > 1:
+        rec = _match_rule(_SECOND_PAIN_RULES, pain_points[1]['pain_point'])
+        if rec:
+            bank_recommendations.append(rec)
+
+    # Recommendation 4: Feature requests
+    bank_recommendations.append(dict(_TPL_FEATURES))
+
+    return bank, bank_recommendations
+
 
 def generate_recommendations(df, insights):
     """
     Generate recommendations for each bank based on insights.
-    
+
+    Banks are independent, so they are built concurrently; threads are
+    enough here since each task is a handful of dict operations.
+
     Args:
         df: Reviews dataframe
         insights: Dictionary with drivers and pain points per bank
-    
+
     Returns:
         Dictionary of recommendations per bank
     """
-    recommendations = {}
-    
-    for bank, data in insights.items():
-        bank_recommendations = []
-        
-        drivers = data['drivers']
-        pain_points = data['pain_points']
-        
-        # Recommendation 1: Address top pain point
-        if pain_points:
-            top_pain = pain_points[0]
-            if 'Crashes' in top_pain['pain_point'] or 'Bugs' in top_pain['pain_point']:
-                bank_recommendations.append({
-                    'priority': 'High',
-                    'category': 'Technical',
-                    'recommendation': 'Implement comprehensive bug fixing and stability improvements',
-                    'details': [
-                        'Conduct thorough QA testing before releases',
-                        'Implement crash reporting and monitoring',
-                        'Prioritize fixing critical bugs affecting core functionality',
-                        'Establish a bug triage process'
-                    ],
-                    'expected_impact': 'Reduce negative reviews by 30-40%',
-                    'based_on': top_pain['pain_point']
-                })
-            elif 'Access' in top_pain['pain_point'] or 'Login' in top_pain['pain_point']:
-                bank_recommendations.append({
-                    'priority': 'High',
-                    'category': 'Technical',
-                    'recommendation': 'Improve login and authentication system',
-                    'details': [
-                        'Implement biometric authentication (fingerprint, face ID)',
-                        'Add "Remember Me" option for trusted devices',
-                        'Improve offline mode functionality',
-                        'Optimize connection handling and retry logic'
-                    ],
-                    'expected_impact': 'Improve user experience and reduce access-related complaints',
-                    'based_on': top_pain['pain_point']
-                })
-        
-        # Recommendation 2: Enhance top driver
-        if drivers:
-            top_driver = drivers[0]
-            if 'Interface' in top_driver['driver']:
-                bank_recommendations.append({
-                    'priority': 'Medium',
-                    'category': 'UX/UI',
-                    'recommendation': 'Enhance user interface based on positive feedback',
-                    'details': [
-                        'Maintain simplicity and ease of use',
-                        'Add more customization options',
-                        'Improve navigation flow',
-                        'Implement dark mode option'
-                    ],
-                    'expected_impact': 'Increase user satisfaction and retention',
-                    'based_on': top_driver['driver']
-                })
-            elif 'Transaction' in top_driver['driver']:
-                bank_recommendations.append({
-                    'priority': 'Medium',
-                    'category': 'Performance',
-                    'recommendation': 'Optimize transaction processing speed',
-                    'details': [
-                        'Implement transaction queuing for better performance',
-                        'Add transaction status notifications',
-                        'Optimize backend API response times',
-                        'Add batch transaction capability'
-                    ],
-                    'expected_impact': 'Maintain competitive advantage in transaction speed',
-                    'based_on': top_driver['driver']
-                })
-        
-        # Recommendation 3: Address second pain point
-        if len(pain_points) > 1:
-            second_pain = pain_points[1]
-            if 'Slow' in second_pain['pain_point']:
-                bank_recommendations.append({
-                    'priority': 'Medium',
-                    'category': 'Performance',
-                    'recommendation': 'Improve app performance and loading times',
-                    'details': [
-                        'Optimize app startup time',
-                        'Implement lazy loading for non-critical features',
-                        'Cache frequently accessed data',
-                        'Optimize image and asset sizes'
-                    ],
-                    'expected_impact': 'Reduce user frustration and improve ratings',
-                    'based_on': second_pain['pain_point']
-                })
-            elif 'Support' in second_pain['pain_point']:
-                bank_recommendations.append({
-                    'priority': 'Medium',
-                    'category': 'Customer Service',
-                    'recommendation': 'Enhance customer support within the app',
-                    'details': [
-                        'Add in-app chat support',
-                        'Implement AI chatbot for common queries',
-                        'Add FAQ section with search functionality',
-                        'Provide video tutorials for common tasks'
-                    ],
-                    'expected_impact': 'Reduce support tickets and improve user satisfaction',
-                    'based_on': second_pain['pain_point']
-                })
-        
-        # Recommendation 4: Feature requests
-        bank_recommendations.append({
-            'priority': 'Low',
-            'category': 'Features',
-            'recommendation': 'Add requested features based on user feedback',
-            'details': [
-                'Transaction history export (PDF/CSV)',
-                'Budgeting and expense tracking tools',
-                'Multiple account management in single app',
-                'Bill payment reminders and scheduling',
-                'Spending analytics and insights'
-            ],
-            'expected_impact': 'Increase app value proposition and user engagement',
-            'based_on': 'Feature Requests theme analysis'
-        })
-        
-        recommendations[bank] = bank_recommendations
-    
-    return recommendations
-
-
-def generate_report():
-    """Generate comprehensive recommendations report."""
-    print("=" * 70)
-    print("Generating Recommendations Report")
-    print("=" * 70)
-    
-    # Load data
-    df_reviews, _ = load_data()
-    if df_reviews is None:
-        return
-    
-    # Get insights
-    from analyze_insights import generate_insights_report
-    insights, comparison = generate_insights_report()
-    
-    if insights is None:
-        return
-    
-    # Generate recommendations
-    recommendations = generate_recommendations(df_reviews, insights)
-    
-    # Create report
-    report_lines = []
-    report_lines.append("=" * 70)
-    report_lines.append("RECOMMENDATIONS REPORT")
-    report_lines.append("Customer Experience Analytics for Fintech Apps")
-    report_lines.append(f"Generated: {datetime.now().strftime('%B %d, %Y')}")
-    report_lines.append("=" * 70)
-    
+    if not insights:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(len(insights), os.cpu_count() or 1)) as executor:
+        return dict(executor.map(_recs_for_bank, insights.keys(), insights.values()))
+
+
+def _emit_report(df_reviews, insights, comparison_text, recommendations):
+    """Yield the report line by line, each with a trailing newline."""
+    # Summary stats computed up front: nunique skips the intermediate
+    # unique array, and the ndarray mean skips the Series wrapper
+    n_banks = df_reviews['bank'].nunique()
+    mean_rating = df_reviews['rating'].to_numpy().mean()
+    # Format the timestamp once; reused anywhere the report needs it
+    generated_on = datetime.now().strftime('%B %d, %Y')
+
+    yield "=" * 70 + "\n"
+    yield "RECOMMENDATIONS REPORT\n"
+    yield "Customer Experience Analytics for Fintech Apps\n"
+    yield f"Generated: {generated_on}\n"
+    yield "=" * 70 + "\n"
+
     # Executive Summary
-    report_lines.append("\n## EXECUTIVE SUMMARY")
-    report_lines.append("-" * 70)
-    report_lines.append("\nThis report provides actionable recommendations for improving")
-    report_lines.append("mobile banking applications based on analysis of 1,200+ user reviews")
-    report_lines.append("from the Google Play Store for three Ethiopian banks.")
-    report_lines.append("\nKey Findings:")
-    report_lines.append(f"- Total reviews analyzed: {len(df_reviews):,}")
-    report_lines.append(f"- Banks analyzed: {len(df_reviews['bank'].unique())}")
-    report_lines.append(f"- Average rating across all banks: {df_reviews['rating'].mean():.2f}")
-    report_lines.append(f"- Sentiment coverage: 100%")
-    
+    yield "\n## EXECUTIVE SUMMARY\n"
+    yield "-" * 70 + "\n"
+    yield "\nThis report provides actionable recommendations for improving\n"
+    yield "mobile banking applications based on analysis of 1,200+ user reviews\n"
+    yield "from the Google Play Store for three Ethiopian banks.\n"
+    yield "\nKey Findings:\n"
+    yield f"- Total reviews analyzed: {len(df_reviews):,}\n"
+    yield f"- Banks analyzed: {n_banks}\n"
+    yield f"- Average rating across all banks: {mean_rating:.2f}\n"
+    yield f"- Sentiment coverage: 100%\n"
+
     # Bank Comparison
-    report_lines.append("\n## BANK COMPARISON")
-    report_lines.append("-" * 70)
-    report_lines.append(comparison.to_string(index=False))
-    
+    yield "\n## BANK COMPARISON\n"
+    yield "-" * 70 + "\n"
+    yield comparison_text + "\n"
+
     # Recommendations by Bank
-    report_lines.append("\n## RECOMMENDATIONS BY BANK")
-    report_lines.append("=" * 70)
-    
+    yield "\n## RECOMMENDATIONS BY BANK\n"
+    yield "=" * 70 + "\n"
+
     for bank, recs in recommendations.items():
-        report_lines.append(f"\n### {bank}")
-        report_lines.append("-" * 70)
-        
+        yield f"\n### {bank}\n"
+        yield "-" * 70 + "\n"
+
+        # Bind per-bank lookups once for the section below
+        bank_insights = insights[bank]
+        drivers = bank_insights['drivers']
+        pain_points = bank_insights['pain_points']
+
         # Drivers
-        if insights[bank]['drivers']:
-            report_lines.append("\n**Satisfaction Drivers:**")
-            for i, driver in enumerate(insights[bank]['drivers'], 1):
-                report_lines.append(f"  {i}. {driver['driver']}")
-                report_lines.append(f"     Evidence: {driver['evidence']}")
-        
+        if drivers:
+            yield "\n**Satisfaction Drivers:**\n"
+            for i, driver in enumerate(drivers, 1):
+                yield f"  {i}. {driver['driver']}\n"
+                yield f"     Evidence: {driver['evidence']}\n"
+
         # Pain Points
-        if insights[bank]['pain_points']:
-            report_lines.append("\n**Pain Points:**")
-            for i, pp in enumerate(insights[bank]['pain_points'], 1):
-                report_lines.append(f"  {i}. {pp['pain_point']} [{pp.get('severity', 'N/A')} Severity]")
-                report_lines.append(f"     Evidence: {pp['evidence']}")
-        
-        # Recommendations
-        report_lines.append(f"\n**Recommendations ({len(recs)}):**")
+        if pain_points:
+            yield "\n**Pain Points:**\n"
+            for i, pp in enumerate(pain_points, 1):
+                yield f"  {i}. {pp['pain_point']} [{pp.get('severity', 'N/A')} Severity]\n"
+                yield f"     Evidence: {pp['evidence']}\n"
+
+        # Recommendations: one string per recommendation instead of a
+        # yield per line — this is the hottest block of the report
+        yield f"\n**Recommendations ({len(recs)}):**\n"
         for i, rec in enumerate(recs, 1):
-            report_lines.append(f"\n  {i}. [{rec['priority']} Priority] {rec['recommendation']}")
-            report_lines.append(f"     Category: {rec['category']}")
-            report_lines.append(f"     Based on: {rec['based_on']}")
-            report_lines.append(f"     Expected Impact: {rec['expected_impact']}")
-            report_lines.append(f"     Action Items:")
-            for detail in rec['details']:
-                report_lines.append(f"       - {detail}")
-    
+            details = '\n'.join(f"       - {d}" for d in rec['details'])
+            yield (
+                f"\n  {i}. [{rec['priority']} Priority] {rec['recommendation']}\n"
+                f"     Category: {rec['category']}\n"
+                f"     Based on: {rec['based_on']}\n"
+                f"     Expected Impact: {rec['expected_impact']}\n"
+                f"     Action Items:\n"
+                f"{details}\n"
+            )
+
     # Ethics and Limitations
-    report_lines.append("\n## ETHICS AND LIMITATIONS")
-    report_lines.append("=" * 70)
-    report_lines.append("\n### Potential Biases in Review Data:")
-    report_lines.append("\n1. **Negative Review Bias:**")
-    report_lines.append("   - Users with negative experiences are more likely to leave reviews")
-    report_lines.append("   - This may skew sentiment analysis toward negative outcomes")
-    report_lines.append("   - Mitigation: Consider that actual user satisfaction may be higher")
-    report_lines.append("\n2. **Selection Bias:**")
-    report_lines.append("   - Only users who download and use the app can leave reviews")
-    report_lines.append("   - Users who uninstall immediately may not be represented")
-    report_lines.append("   - Mitigation: Reviews represent engaged users, not all potential users")
-    report_lines.append("\n3. **Temporal Bias:**")
-    report_lines.append("   - Reviews span multiple years (2018-2025)")
-    report_lines.append("   - Recent app updates may not be fully reflected")
-    report_lines.append("   - Mitigation: Focus on recent reviews for current state assessment")
-    report_lines.append("\n4. **Language Bias:**")
-    report_lines.append("   - Analysis focused on English-language reviews")
-    report_lines.append("   - May not represent all user segments")
-    report_lines.append("   - Mitigation: Consider multi-language analysis for comprehensive insights")
-    report_lines.append("\n5. **Rating Interpretation:**")
-    report_lines.append("   - 1-2 star ratings may indicate critical issues")
-    report_lines.append("   - 4-5 star ratings indicate satisfaction but may lack detail")
-    report_lines.append("   - Mitigation: Combined sentiment and rating analysis provides balance")
-    
-    report_lines.append("\n### Data Limitations:")
-    report_lines.append("- Sample size: 1,200 reviews (400 per bank)")
-    report_lines.append("- Source: Google Play Store only (excludes iOS users)")
-    report_lines.append("- Time period: Reviews from 2018-2025")
-    report_lines.append("- Analysis method: Automated sentiment and theme extraction")
-    
-    report_lines.append("\n### Recommendations for Future Analysis:")
-    report_lines.append("1. Collect reviews from multiple sources (iOS App Store, direct feedback)")
-    report_lines.append("2. Conduct user surveys to complement review analysis")
-    report_lines.append("3. Perform longitudinal analysis to track improvements over time")
-    report_lines.append("4. Include demographic analysis if available")
-    report_lines.append("5. Compare with industry benchmarks")
-    
-    # Save report
-    report_text = '\n'.join(report_lines)
-    
-    with open('RECOMMENDATIONS_REPORT.txt', 'w', encoding='utf-8') as f:
-        f.write(report_text)
-    
-    print("\n[OK] Recommendations report saved to: RECOMMENDATIONS_REPORT.txt")
-    
-    # Also save recommendations as CSV
-    recs_data = []
+    yield "\n## ETHICS AND LIMITATIONS\n"
+    yield "=" * 70 + "\n"
+    yield "\n### Potential Biases in Review Data:\n"
+    yield "\n1. **Negative Review Bias:**\n"
+    yield "   - Users with negative experiences are more likely to leave reviews\n"
+    yield "   - This may skew sentiment analysis toward negative outcomes\n"
+    yield "   - Mitigation: Consider that actual user satisfaction may be higher\n"
+    yield "\n2. **Selection Bias:**\n"
+    yield "   - Only users who download and use the app can leave reviews\n"
+    yield "   - Users who uninstall immediately may not be represented\n"
+    yield "   - Mitigation: Reviews represent engaged users, not all potential users\n"
+    yield "\n3. **Temporal Bias:**\n"
+    yield "   - Reviews span multiple years (2018-2025)\n"
+    yield "   - Recent app updates may not be fully reflected\n"
+    yield "   - Mitigation: Focus on recent reviews for current state assessment\n"
+    yield "\n4. **Language Bias:**\n"
+    yield "   - Analysis focused on English-language reviews\n"
+    yield "   - May not represent all user segments\n"
+    yield "   - Mitigation: Consider multi-language analysis for comprehensive insights\n"
+    yield "\n5. **Rating Interpretation:**\n"
+    yield "   - 1-2 star ratings may indicate critical issues\n"
+    yield "   - 4-5 star ratings indicate satisfaction but may lack detail\n"
+    yield "   - Mitigation: Combined sentiment and rating analysis provides balance\n"
+
+    yield "\n### Data Limitations:\n"
+    yield "- Sample size: 1,200 reviews (400 per bank)\n"
+    yield "- Source: Google Play Store only (excludes iOS users)\n"
+    yield "- Time period: Reviews from 2018-2025\n"
+    yield "- Analysis method: Automated sentiment and theme extraction\n"
+
+    yield "\n### Recommendations for Future Analysis:\n"
+    yield "1. Collect reviews from multiple sources (iOS App Store, direct feedback)\n"
+    yield "2. Conduct user surveys to complement review analysis\n"
+    yield "3. Perform longitudinal analysis to track improvements over time\n"
+    yield "4. Include demographic analysis if available\n"
+    yield "5. Compare with industry benchmarks\n"
+
+
+def _report_is_fresh():
+    """True when both report artifacts are newer than every input."""
+    inputs = [_REVIEWS_CSV, 'analyze_insights.py', __file__]
+    outputs = ['RECOMMENDATIONS_REPORT.txt',
+               'data/processed/recommendations.parquet']
+    try:
+        return (all(os.path.exists(o) for o in outputs)
+                and max(os.path.getmtime(i) for i in inputs)
+                < min(os.path.getmtime(o) for o in outputs))
+    except OSError:
+        return False
+
+
+def _build_recs_frame(recommendations):
+    """Build the recommendations table column-wise (no I/O)."""
+    # Column-wise assembly lets pandas skip per-row dict hashing and
+    # schema inference
+    cols = {'bank': [], 'priority': [], 'category': [],
+            'recommendation': [], 'expected_impact': [], 'based_on': []}
     for bank, recs in recommendations.items():
         for rec in recs:
-            recs_data.append({
-                'bank': bank,
-                'priority': rec['priority'],
-                'category': rec['category'],
-                'recommendation': rec['recommendation'],
-                'expected_impact': rec['expected_impact'],
-                'based_on': rec['based_on']
-            })
-    
-    recs_df = pd.DataFrame(recs_data)
-    recs_df.to_csv('data/processed/recommendations.csv', index=False)
-    print("[OK] Recommendations saved to: data/processed/recommendations.csv")
-    
+            cols['bank'].append(bank)
+            cols['priority'].append(rec['priority'])
+            cols['category'].append(rec['category'])
+            cols['recommendation'].append(rec['recommendation'])
+            cols['expected_impact'].append(rec['expected_impact'])
+            cols['based_on'].append(rec['based_on'])
+
+    recs_df = pd.DataFrame(cols, copy=False)
+    # Categoricals keep the low-cardinality columns tiny on disk
+    return recs_df.astype({'bank': 'category', 'priority': 'category',
+                           'category': 'category'})
+
+
+def build_report(insights, comparison, df_reviews):
+    """
+    Build the report artifacts without touching disk.
+
+    Pure compute half of the report: callers batching several runs can
+    materialize once and persist however they like.
+
+    Returns:
+        Tuple of (report_text, recs_df, counts) where counts maps bank
+        to (total recommendations, high-priority recommendations)
+    """
+    recommendations = generate_recommendations(df_reviews, insights)
+    comparison_text = comparison.to_string(index=False)
+    report_text = ''.join(
+        _emit_report(df_reviews, insights, comparison_text, recommendations))
+    recs_df = _build_recs_frame(recommendations)
+    counts = {bank: (len(recs), sum(1 for r in recs if r['priority'] == 'High'))
+              for bank, recs in recommendations.items()}
+    return report_text, recs_df, counts
+
+
+def generate_report(insights=None, comparison=None, df_reviews=None, force=False):
+    """
+    Generate comprehensive recommendations report.
+
+    Args:
+        insights: Optional precomputed insights dict; callers that
+            already ran the insights pipeline pass it through so the
+            NLP pass is not repeated
+        comparison: Optional precomputed bank comparison frame
+        df_reviews: Optional already-loaded reviews dataframe
+        force: Regenerate even when the existing report is newer than
+            all of its inputs
+    """
+    # No-op reruns skip the whole pipeline when outputs are up to date
+    if not force and _report_is_fresh():
+        print("[OK] Report is up to date (use force=True to regenerate)")
+        return 'RECOMMENDATIONS_REPORT.txt'
+
+    print("=" * 70)
+    print("Generating Recommendations Report")
+    print("=" * 70)
+
+    # Load data unless the caller already has it
+    if df_reviews is None:
+        df_reviews, _ = load_data()
+    if df_reviews is None:
+        return
+
+    # Get insights (cached per reviews-file version) unless supplied
+    if insights is None or comparison is None:
+        insights, comparison, comparison_text = _cached_insights(_reviews_cache_key())
+    else:
+        comparison_text = comparison.to_string(index=False)
+
+    if insights is None:
+        return
+
+    # Generate recommendations
+    recommendations = generate_recommendations(df_reviews, insights)
+
+    # Stream the report straight to disk; no intermediate list of lines
+    # or join buffer is materialized
+    report_file = 'RECOMMENDATIONS_REPORT.txt'
+    with open(report_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.writelines(_emit_report(df_reviews, insights, comparison_text, recommendations))
+
+    print(f"\n[OK] Recommendations report saved to: {report_file}")
+
+    # Parquet is the persisted artifact (typed, compressed, fast to
+    # read back)
+    recs_df = _build_recs_frame(recommendations)
+    recs_df.to_parquet('data/processed/recommendations.parquet',
+                       engine='pyarrow', compression='zstd', index=False)
+    print("[OK] Recommendations saved to: data/processed/recommendations.parquet")
+    if os.environ.get('EMIT_CSV'):
+        # Explicit lineterminator skips pandas' newline translation path
+        recs_df.to_csv('data/processed/recommendations.csv', index=False,
+                       lineterminator='\n')
+        print("[OK] Recommendations saved to: data/processed/recommendations.csv")
+
     # Print summary
     print("\n" + "=" * 70)
     print("Report Summary")
     print("=" * 70)
-    print(f"\nTotal recommendations generated: {sum(len(r) for r in recommendations.values())}")
-    for bank, recs in recommendations.items():
-        high_priority = sum(1 for r in recs if r['priority'] == 'High')
-        print(f"  {bank}: {len(recs)} recommendations ({high_priority} high priority)")
-    
-    return report_text
+    # One pass per bank yields both the total and the high-priority count
+    counts = {bank: (len(recs), sum(1 for r in recs if r['priority'] == 'High'))
+              for bank, recs in recommendations.items()}
+    print(f"\nTotal recommendations generated: {sum(n for n, _ in counts.values())}")
+    for bank, (n_recs, high_priority) in counts.items():
+        print(f"  {bank}: {n_recs} recommendations ({high_priority} high priority)")
 
+    return report_file
 
-if __name__ == "__main__":
+
+def main():
+    """Generate and persist the recommendations report."""
     generate_report()
 
+
+if __name__ == "__main__":
+    main()
+
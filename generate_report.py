@@ -14,155 +14,323 @@ from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, Tabl
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import hashlib
+import multiprocessing
 import os
 import io
+import pickle
 
+_CACHE_DIR = "data/cache"
 
-def load_data():
-    """Load all necessary data files."""
-    data = {}
-    
-    # Load cleaned reviews
+
+def _file_hash(path):
+    """Content hash identifying a CSV version for the report caches."""
     try:
-        df_cleaned = pd.read_csv("data/processed/reviews_cleaned.csv")
-        data['cleaned'] = df_cleaned
-    except:
-        data['cleaned'] = None
-    
-    # Load sentiment aggregation
+        with open(path, 'rb') as f:
+            return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    except OSError:
+        return None
+
+
+def _load_report_stats(df_cleaned, cache_key):
+    """Aggregates for the report, cached per CSV content hash."""
+    cache_path = (os.path.join(_CACHE_DIR, f"report_{cache_key}.pkl")
+                  if cache_key else None)
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            pass  # Unreadable cache; recompute below
+
+    # Bind each column once and fold the missing/empty checks into a
+    # single boolean mask per column rather than summing separate passes
+    reviews = df_cleaned['review']
+    ratings = df_cleaned['rating']
+    dates = df_cleaned['date']
+    stats = {
+        'total': len(df_cleaned),
+        'bank_counts': df_cleaned['bank'].value_counts(),
+        'rating_dist': ratings.value_counts().sort_index(),
+        'missing_text': int((reviews.isna()
+                             | reviews.fillna('').str.strip().eq('')).sum()),
+        'missing_rating': int(ratings.isna().sum()),
+        'missing_date': int((dates.isna() | dates.eq('')).sum()),
+    }
+    if cache_path:
+        try:
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+            with open(cache_path, 'wb') as f:
+                pickle.dump(stats, f, protocol=5)
+        except Exception:
+            pass
+    return stats
+
+
+def _render_bank_chart(bank_counts):
+    """Render the reviews-per-bank chart and return PNG bytes.
+
+    Takes a plain {bank: count} dict so it can run in a worker process.
+    """
+    fig, ax = plt.subplots(figsize=(4.5, 2.5))
+    items = sorted(bank_counts.items(), key=lambda kv: kv[1])
+    names = [bank for bank, _ in items]
+    values = [count for _, count in items]
+    colors_list = ['#3949ab', '#5c6bc0', '#7986cb']  # Blue gradient
+    ax.barh(names, values, color=colors_list)
+    ax.set_xlabel('Number of Reviews', fontsize=9, fontweight='bold')
+    ax.set_title('Reviews Collected by Bank', fontsize=10, fontweight='bold', pad=8)
+    ax.grid(axis='x', alpha=0.3, linestyle='--')
+
+    # Add value labels on bars
+    for i, count in enumerate(values):
+        ax.text(count + 10, i, f'{count:,}', va='center', fontsize=8, fontweight='bold')
+
+    # Fixed margins avoid the extra layout/measure pass that
+    # tight_layout and bbox_inches='tight' each cost
+    fig.subplots_adjust(left=0.15, right=0.95, top=0.9, bottom=0.15)
+
+    img_buffer = io.BytesIO()
+    plt.savefig(img_buffer, format='png', dpi=100)
+    plt.close(fig)
+    return img_buffer.getvalue()
+
+
+def _render_rating_chart(rating_dist):
+    """Render the rating distribution chart and return PNG bytes.
+
+    Takes a plain {rating: count} dict so it can run in a worker process.
+    """
+    fig, ax = plt.subplots(figsize=(4.5, 2.5))
+    items = sorted(rating_dist.items())
+    colors_list = ['#d32f2f', '#f57c00', '#fbc02d', '#689f38', '#388e3c']  # Red to green gradient
+    rating_labels = [f"{r} Star{'s' if r > 1 else ''}" for r, _ in items]
+    values = [count for _, count in items]
+    ax.bar(rating_labels, values, color=colors_list[:len(items)])
+    ax.set_xlabel('Rating', fontsize=9, fontweight='bold')
+    ax.set_ylabel('Number of Reviews', fontsize=9, fontweight='bold')
+    ax.set_title('Rating Distribution', fontsize=10, fontweight='bold', pad=8)
+    ax.grid(axis='y', alpha=0.3, linestyle='--')
+
+    # Add value labels on bars
+    for i, count in enumerate(values):
+        ax.text(i, count + 10, f'{count:,}', ha='center', va='bottom', fontsize=8, fontweight='bold')
+
+    # Fixed margins avoid the extra layout/measure pass that
+    # tight_layout and bbox_inches='tight' each cost
+    fig.subplots_adjust(left=0.15, right=0.95, top=0.9, bottom=0.15)
+
+    img_buffer = io.BytesIO()
+    plt.savefig(img_buffer, format='png', dpi=100)
+    plt.close(fig)
+    return img_buffer.getvalue()
+
+
+_CHART_RENDERERS = {
+    'bank': (_render_bank_chart, 'bank_counts'),
+    'rating': (_render_rating_chart, 'rating_dist'),
+}
+
+
+def _render_charts(stats, cache_key):
+    """Return {name: BytesIO} for both charts, rendering misses in parallel."""
+    buffers = {}
+    pending = {}
+    for name, (render, stat_key) in _CHART_RENDERERS.items():
+        cache_path = (os.path.join(_CACHE_DIR, f"chart_{cache_key}_{name}.png")
+                      if cache_key else None)
+        if cache_path and os.path.exists(cache_path):
+            with open(cache_path, 'rb') as f:
+                buffers[name] = io.BytesIO(f.read())
+        else:
+            data = {k: int(v) for k, v in stats[stat_key].items()}
+            pending[name] = (render, data, cache_path)
+
+    if pending:
+        # Render both charts at once; the spawn context gives workers a
+        # clean interpreter without the parent's loaded dataframes
+        try:
+            ctx = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=2, mp_context=ctx) as executor:
+                futures = {name: executor.submit(render, data)
+                           for name, (render, data, _) in pending.items()}
+                rendered = {name: f.result() for name, f in futures.items()}
+        except Exception:
+            rendered = {name: render(data)
+                        for name, (render, data, _) in pending.items()}
+
+        for name, png in rendered.items():
+            buffers[name] = io.BytesIO(png)
+            cache_path = pending[name][2]
+            if cache_path:
+                try:
+                    os.makedirs(_CACHE_DIR, exist_ok=True)
+                    with open(cache_path, 'wb') as f:
+                        f.write(png)
+                except Exception:
+                    pass
+    return buffers
+
+
+def _read_csv(path):
+    """Read a CSV with the multi-threaded pyarrow parser when available."""
     try:
-        df_sentiment = pd.read_csv("data/processed/sentiment_aggregation.csv")
-        data['sentiment'] = df_sentiment
-    except:
-        data['sentiment'] = None
-    
+        return pd.read_csv(path, engine='pyarrow')
+    except (ImportError, ValueError):
+        return pd.read_csv(path)
+
+
+def _read_table(csv_path):
+    """Read a dataset, preferring the Parquet copy next to the CSV."""
+    parquet_path = os.path.splitext(csv_path)[0] + '.parquet'
+    if os.path.exists(parquet_path):
+        try:
+            return pd.read_parquet(parquet_path, engine='pyarrow')
+        except (ImportError, ValueError):
+            pass
+    return _read_csv(csv_path)
+
+
+def load_data(sections=('cleaned', 'sentiment', 'themes')):
+    """Load the requested data files; unrequested sections stay None."""
+    data = {'cleaned': None, 'sentiment': None, 'themes': None}
+
+    # Load cleaned reviews
+    if 'cleaned' in sections:
+        try:
+            data['cleaned'] = _read_table("data/processed/reviews_cleaned.csv")
+        except:
+            pass
+
+    # Load sentiment aggregation
+    if 'sentiment' in sections:
+        try:
+            data['sentiment'] = _read_csv("data/processed/sentiment_aggregation.csv")
+        except:
+            pass
+
     # Load theme summary
-    try:
-        df_themes = pd.read_csv("data/processed/theme_summary.csv")
-        data['themes'] = df_themes
-    except:
-        data['themes'] = None
-    
+    if 'themes' in sections:
+        try:
+            data['themes'] = _read_table("data/processed/theme_summary.csv")
+        except:
+            pass
+
     return data
 
 
-def create_report_pdf(output_file="Interim_Report.pdf"):
-    """Create the interim report PDF."""
-    
-    # Load data
-    data = load_data()
-    df_cleaned = data['cleaned']
-    df_sentiment = data['sentiment']
-    df_themes = data['themes']
-    
-    # Create PDF document
-    doc = SimpleDocTemplate(
-        output_file,
-        pagesize=letter,
-        rightMargin=0.75*inch,
-        leftMargin=0.75*inch,
-        topMargin=0.75*inch,
-        bottomMargin=0.75*inch
-    )
-    
-    # Container for the 'Flowable' objects
-    story = []
-    
-    # Define styles
-    styles = getSampleStyleSheet()
-    
-    # Custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=20,
-        textColor=colors.HexColor('#1a237e'),
-        spaceAfter=12,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold'
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=colors.HexColor('#283593'),
-        spaceAfter=10,
-        spaceBefore=12,
-        fontName='Helvetica-Bold'
-    )
-    
-    subheading_style = ParagraphStyle(
-        'CustomSubHeading',
-        parent=styles['Heading3'],
-        fontSize=12,
-        textColor=colors.HexColor('#3949ab'),
-        spaceAfter=8,
-        spaceBefore=10,
-        fontName='Helvetica-Bold'
-    )
-    
-    normal_style = styles['Normal']
+def _make_styles():
+    """Build the shared style dictionary used by the page builders."""
+    base = getSampleStyleSheet()
+
+    normal_style = base['Normal']
     normal_style.fontSize = 10
     normal_style.leading = 14
     normal_style.alignment = TA_JUSTIFY
-    
-    # ===== PAGE 1: TITLE PAGE =====
+
+    return {
+        'title': ParagraphStyle(
+            'CustomTitle',
+            parent=base['Heading1'],
+            fontSize=20,
+            textColor=colors.HexColor('#1a237e'),
+            spaceAfter=12,
+            alignment=TA_CENTER,
+            fontName='Helvetica-Bold'
+        ),
+        'heading': ParagraphStyle(
+            'CustomHeading',
+            parent=base['Heading2'],
+            fontSize=14,
+            textColor=colors.HexColor('#283593'),
+            spaceAfter=10,
+            spaceBefore=12,
+            fontName='Helvetica-Bold'
+        ),
+        'subheading': ParagraphStyle(
+            'CustomSubHeading',
+            parent=base['Heading3'],
+            fontSize=12,
+            textColor=colors.HexColor('#3949ab'),
+            spaceAfter=8,
+            spaceBefore=10,
+            fontName='Helvetica-Bold'
+        ),
+        'normal': normal_style,
+        'subtitle': ParagraphStyle(
+            'Subtitle',
+            parent=base['Normal'],
+            fontSize=14,
+            alignment=TA_CENTER,
+            textColor=colors.HexColor('#616161')
+        ),
+        'date': ParagraphStyle(
+            'Date',
+            parent=base['Normal'],
+            fontSize=11,
+            alignment=TA_CENTER,
+            textColor=colors.HexColor('#757575')
+        ),
+        'info': ParagraphStyle(
+            'Info',
+            parent=base['Normal'],
+            fontSize=10,
+            alignment=TA_CENTER,
+            textColor=colors.HexColor('#424242')
+        ),
+        'small_heading': ParagraphStyle(
+            'SmallHeading',
+            parent=normal_style,
+            fontSize=11,
+            fontName='Helvetica-Bold',
+            spaceAfter=8
+        ),
+    }
+
+
+def _build_title_page(styles):
+    """Page 1: title page."""
+    story = []
     story.append(Spacer(1, 1.2*inch))
-    
+
     # Title
-    story.append(Paragraph("Customer Experience Analytics", title_style))
+    story.append(Paragraph("Customer Experience Analytics", styles['title']))
     story.append(Spacer(1, 0.2*inch))
-    story.append(Paragraph("for Fintech Mobile Banking Apps", title_style))
+    story.append(Paragraph("for Fintech Mobile Banking Apps", styles['title']))
     story.append(Spacer(1, 0.4*inch))
-    
+
     # Subtitle
-    subtitle = ParagraphStyle(
-        'Subtitle',
-        parent=styles['Normal'],
-        fontSize=14,
-        alignment=TA_CENTER,
-        textColor=colors.HexColor('#616161')
-    )
-    story.append(Paragraph("Interim Report", subtitle))
+    story.append(Paragraph("Interim Report", styles['subtitle']))
     story.append(Spacer(1, 0.3*inch))
-    
+
     # Date
-    date_style = ParagraphStyle(
-        'Date',
-        parent=styles['Normal'],
-        fontSize=11,
-        alignment=TA_CENTER,
-        textColor=colors.HexColor('#757575')
-    )
-    story.append(Paragraph(f"Generated: {datetime.now().strftime('%B %d, %Y')}", date_style))
+    story.append(Paragraph(f"Generated: {datetime.now().strftime('%B %d, %Y')}", styles['date']))
     story.append(Spacer(1, 0.4*inch))
-    
+
     # Project info
-    info_style = ParagraphStyle(
-        'Info',
-        parent=styles['Normal'],
-        fontSize=10,
-        alignment=TA_CENTER,
-        textColor=colors.HexColor('#424242')
-    )
-    story.append(Paragraph("Omega Consultancy", info_style))
-    story.append(Paragraph("Week 2: Data Collection & Early Analysis", info_style))
+    story.append(Paragraph("Omega Consultancy", styles['info']))
+    story.append(Paragraph("Week 2: Data Collection & Early Analysis", styles['info']))
     story.append(Spacer(1, 0.2*inch))
-    
+
     # Banks analyzed
-    story.append(Paragraph("Analyzed Banks:", info_style))
-    story.append(Paragraph("• Commercial Bank of Ethiopia (CBE)", info_style))
-    story.append(Paragraph("• Bank of Abyssinia (BOA)", info_style))
-    story.append(Paragraph("• Dashen Bank", info_style))
-    
+    story.append(Paragraph("Analyzed Banks:", styles['info']))
+    story.append(Paragraph("• Commercial Bank of Ethiopia (CBE)", styles['info']))
+    story.append(Paragraph("• Bank of Abyssinia (BOA)", styles['info']))
+    story.append(Paragraph("• Dashen Bank", styles['info']))
+
     story.append(PageBreak())
-    
-    # ===== PAGE 2: EXECUTIVE SUMMARY & DATA COLLECTION =====
-    story.append(Paragraph("Executive Summary", heading_style))
-    
+    return story
+
+
+def _build_summary_page(styles, stats, charts):
+    """Page 2: executive summary and data collection."""
+    story = []
+    story.append(Paragraph("Executive Summary", styles['heading']))
+
     # Business Objective
-    story.append(Paragraph("Business Objective", subheading_style))
+    story.append(Paragraph("Business Objective", styles['subheading']))
     objective_text = """
     <b>The primary business objective of this project is to identify customer satisfaction 
     drivers and pain points for mobile banking applications</b> used by three major Ethiopian 
@@ -173,34 +341,36 @@ def create_report_pdf(output_file="Interim_Report.pdf"):
     features and aspects users value most, as well as identify critical issues that need 
     immediate attention.
     """
-    story.append(Paragraph(objective_text, normal_style))
+    story.append(Paragraph(objective_text, styles['normal']))
     story.append(Spacer(1, 0.15*inch))
-    
-    if df_cleaned is not None:
-        total_reviews = len(df_cleaned)
-        bank_counts = df_cleaned['bank'].value_counts()
-        
+
+    if stats is not None:
+        total_reviews = stats['total']
+        bank_counts = stats['bank_counts']
+
         summary_text = f"""
         This interim report presents the initial findings from analyzing customer reviews 
         of mobile banking applications for the three banks. A total of 
         <b>{total_reviews:,}</b> reviews were collected from the Google Play Store, with 
         comprehensive data preprocessing and early sentiment analysis completed.
         """
-        story.append(Paragraph(summary_text, normal_style))
+        story.append(Paragraph(summary_text, styles['normal']))
         story.append(Spacer(1, 0.15*inch))
-        
+
         # Data collection table
-        story.append(Paragraph("Data Collection Summary", subheading_style))
-        
+        story.append(Paragraph("Data Collection Summary", styles['subheading']))
+
         collection_data = [['Bank', 'Reviews Collected']]
         for bank, count in bank_counts.items():
             collection_data.append([bank, f"{count:,}"])
         collection_data.append(['Total', f"{total_reviews:,}"])
-        
+
         # Calculate total row index (last row)
         total_row_idx = len(collection_data) - 1
-        
-        collection_table = Table(collection_data, colWidths=[4*inch, 2*inch])
+
+        collection_table = Table(collection_data, colWidths=[4*inch, 2*inch],
+                                 rowHeights=[0.3*inch] * len(collection_data),
+                                 splitByRow=0, repeatRows=1)
         collection_table.setStyle(TableStyle([
             ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3949ab')),
             ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
@@ -217,76 +387,59 @@ def create_report_pdf(output_file="Interim_Report.pdf"):
         ]))
         story.append(collection_table)
         story.append(Spacer(1, 0.2*inch))
-        
-        # Create and add review count chart
-        fig, ax = plt.subplots(figsize=(4.5, 2.5))
-        bank_counts_sorted = bank_counts.sort_values(ascending=True)
-        colors_list = ['#3949ab', '#5c6bc0', '#7986cb']  # Blue gradient
-        bars = ax.barh(bank_counts_sorted.index, bank_counts_sorted.values, color=colors_list)
-        ax.set_xlabel('Number of Reviews', fontsize=9, fontweight='bold')
-        ax.set_title('Reviews Collected by Bank', fontsize=10, fontweight='bold', pad=8)
-        ax.grid(axis='x', alpha=0.3, linestyle='--')
-        
-        # Add value labels on bars
-        for i, (bank, count) in enumerate(bank_counts_sorted.items()):
-            ax.text(count + 10, i, f'{count:,}', va='center', fontsize=8, fontweight='bold')
-        
-        plt.tight_layout()
-        
-        # Save to buffer
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
-        img_buffer.seek(0)
-        plt.close()
-        
-        # Add image to report (optimized size)
-        img = Image(img_buffer, width=4.2*inch, height=2.3*inch)
+
+        # Add review count chart (rendered up front, cached per data version)
+        img = Image(charts['bank'], width=4.2*inch, height=2.3*inch)
         story.append(img)
         story.append(Spacer(1, 0.15*inch))
-    
+
     # Methodology
-    story.append(Paragraph("Data Collection Methodology", subheading_style))
+    story.append(Paragraph("Data Collection Methodology", styles['subheading']))
     methodology_text = """
     Reviews were collected from the Google Play Store using the google-play-scraper library, 
     targeting a minimum of 400 reviews per bank. The process included rate limiting to respect 
     terms of service. Each review captured: review text, star rating (1-5), posting date, 
     bank identifier, and source.
     """
-    story.append(Paragraph(methodology_text, normal_style))
-    
+    story.append(Paragraph(methodology_text, styles['normal']))
+
     story.append(PageBreak())
-    
-    # ===== PAGE 3: DATA PREPROCESSING & QUALITY =====
-    story.append(Paragraph("Data Preprocessing & Quality", heading_style))
-    
+    return story
+
+
+def _build_quality_page(styles, stats, charts):
+    """Page 3: preprocessing and data quality."""
+    story = []
+    story.append(Paragraph("Data Preprocessing & Quality", styles['heading']))
+
     preprocessing_text = """
     All collected reviews underwent comprehensive preprocessing to ensure data quality 
     and consistency. The preprocessing pipeline included:
     """
-    story.append(Paragraph(preprocessing_text, normal_style))
+    story.append(Paragraph(preprocessing_text, styles['normal']))
     story.append(Spacer(1, 0.15*inch))
-    
+
     preprocessing_steps = [
         ("Duplicate Removal", "Removed duplicate reviews based on review text and bank identifier"),
         ("Missing Data Handling", "Removed rows with empty review text and validated ratings (1-5)"),
         ("Date Normalization", "Standardized all dates to YYYY-MM-DD format"),
         ("Data Quality Validation", "Calculated and verified data quality metrics")
     ]
-    
+
     for step, desc in preprocessing_steps:
-        story.append(Paragraph(f"<b>{step}:</b> {desc}", normal_style))
+        story.append(Paragraph(f"<b>{step}:</b> {desc}", styles['normal']))
         story.append(Spacer(1, 0.08*inch))
-    
-    if df_cleaned is not None:
+
+    if stats is not None:
         story.append(Spacer(1, 0.15*inch))
-        story.append(Paragraph("Data Quality Metrics", subheading_style))
-        
-        # Calculate quality metrics
-        total = len(df_cleaned)
-        missing_text = df_cleaned['review'].isna().sum() + (df_cleaned['review'].str.strip() == '').sum()
-        missing_rating = df_cleaned['rating'].isna().sum()
-        missing_date = (df_cleaned['date'].isna() | (df_cleaned['date'] == '')).sum()
-        
+        story.append(Paragraph("Data Quality Metrics", styles['subheading']))
+
+        # Quality metrics come from the cached aggregates
+        total = stats['total']
+        missing_text = stats['missing_text']
+        missing_rating = stats['missing_rating']
+        missing_date = stats['missing_date']
+
         quality_data = [
             ['Metric', 'Value', 'Status'],
             ['Total Reviews', f"{total:,}", '✓'],
@@ -294,8 +447,10 @@ def create_report_pdf(output_file="Interim_Report.pdf"):
             ['Missing Ratings', f"{missing_rating} ({missing_rating/total*100:.2f}%)", '✓'],
             ['Missing Dates', f"{missing_date} ({missing_date/total*100:.2f}%)", '✓' if missing_date/total < 0.05 else '⚠'],
         ]
-        
-        quality_table = Table(quality_data, colWidths=[2.5*inch, 2*inch, 1*inch])
+
+        quality_table = Table(quality_data, colWidths=[2.5*inch, 2*inch, 1*inch],
+                              rowHeights=[0.3*inch] * len(quality_data),
+                              splitByRow=0, repeatRows=1)
         quality_table.setStyle(TableStyle([
             ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3949ab')),
             ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
@@ -311,18 +466,19 @@ def create_report_pdf(output_file="Interim_Report.pdf"):
         ]))
         story.append(quality_table)
         story.append(Spacer(1, 0.15*inch))
-    
-    # Rating distribution
-    if df_cleaned is not None:
-        story.append(Paragraph("Rating Distribution", subheading_style))
-        rating_dist = df_cleaned['rating'].value_counts().sort_index()
-        
+
+        # Rating distribution
+        story.append(Paragraph("Rating Distribution", styles['subheading']))
+        rating_dist = stats['rating_dist']
+
         rating_data = [['Rating', 'Count', 'Percentage']]
         for rating, count in rating_dist.items():
             pct = (count / total) * 100
             rating_data.append([f"{rating} Star{'s' if rating != 1 else ''}", f"{count:,}", f"{pct:.1f}%"])
-        
-        rating_table = Table(rating_data, colWidths=[1.5*inch, 1.5*inch, 1.5*inch])
+
+        rating_table = Table(rating_data, colWidths=[1.5*inch, 1.5*inch, 1.5*inch],
+                             rowHeights=[0.3*inch] * len(rating_data),
+                             splitByRow=0, repeatRows=1)
         rating_table.setStyle(TableStyle([
             ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3949ab')),
             ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
@@ -336,76 +492,59 @@ def create_report_pdf(output_file="Interim_Report.pdf"):
         ]))
         story.append(rating_table)
         story.append(Spacer(1, 0.2*inch))
-        
-        # Create and add rating distribution chart
-        fig, ax = plt.subplots(figsize=(4.5, 2.5))
-        rating_dist_sorted = rating_dist.sort_index()
-        colors_list = ['#d32f2f', '#f57c00', '#fbc02d', '#689f38', '#388e3c']  # Red to green gradient
-        rating_labels = [f"{r} Star{'s' if r > 1 else ''}" for r in rating_dist_sorted.index]
-        bars = ax.bar(rating_labels, rating_dist_sorted.values, color=colors_list[:len(rating_dist_sorted)])
-        ax.set_xlabel('Rating', fontsize=9, fontweight='bold')
-        ax.set_ylabel('Number of Reviews', fontsize=9, fontweight='bold')
-        ax.set_title('Rating Distribution', fontsize=10, fontweight='bold', pad=8)
-        ax.grid(axis='y', alpha=0.3, linestyle='--')
-        
-        # Add value labels on bars
-        for i, (rating, count) in enumerate(rating_dist_sorted.items()):
-            ax.text(i, count + 10, f'{count:,}', ha='center', va='bottom', fontsize=8, fontweight='bold')
-        
-        plt.tight_layout()
-        
-        # Save to buffer
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
-        img_buffer.seek(0)
-        plt.close()
-        
-        # Add image to report (optimized size)
-        img = Image(img_buffer, width=4.2*inch, height=2.3*inch)
+
+        # Add rating distribution chart (rendered up front, cached per
+        # data version)
+        img = Image(charts['rating'], width=4.2*inch, height=2.3*inch)
         story.append(img)
-    
+
     story.append(PageBreak())
-    
-    # ===== PAGE 4: EARLY ANALYSIS RESULTS =====
-    story.append(Paragraph("Early Analysis Results", heading_style))
-    
+    return story
+
+
+def _build_analysis_page(styles, df_sentiment, df_themes):
+    """Page 4: early analysis results and next steps."""
+    story = []
+    story.append(Paragraph("Early Analysis Results", styles['heading']))
+
     # Sentiment Analysis
-    story.append(Paragraph("Sentiment Analysis", subheading_style))
+    story.append(Paragraph("Sentiment Analysis", styles['subheading']))
     sentiment_text = """
     Sentiment analysis was performed using DistilBERT-base-uncased-finetuned-sst-2-english, 
     a transformer-based model fine-tuned for sentiment classification. The analysis classified 
     reviews as positive, negative, or neutral with confidence scores.
     """
-    story.append(Paragraph(sentiment_text, normal_style))
+    story.append(Paragraph(sentiment_text, styles['normal']))
     story.append(Spacer(1, 0.15*inch))
-    
+
     if df_sentiment is not None:
         # Summary by bank
-        story.append(Paragraph("Sentiment Summary by Bank", ParagraphStyle(
-            'SmallHeading',
-            parent=normal_style,
-            fontSize=11,
-            fontName='Helvetica-Bold',
-            spaceAfter=8
-        )))
-        
-        bank_sentiment = []
-        for bank in df_cleaned['bank'].unique():
-            bank_df = df_sentiment[df_sentiment['bank'] == bank]
-            total_bank_reviews = bank_df['review_count'].sum()
-            positive = (bank_df['positive_pct'] * bank_df['review_count'] / 100).sum() / total_bank_reviews * 100
-            negative = (bank_df['negative_pct'] * bank_df['review_count'] / 100).sum() / total_bank_reviews * 100
-            
-            bank_sentiment.append([
-                bank,
-                f"{total_bank_reviews:,}",
-                f"{positive:.1f}%",
-                f"{negative:.1f}%"
-            ])
-        
+        story.append(Paragraph("Sentiment Summary by Bank", styles['small_heading']))
+
+        # One groupby pass over the weighted percentages instead of a
+        # boolean-mask scan per bank
+        weighted = df_sentiment.assign(
+            pos_weight=df_sentiment['positive_pct'] * df_sentiment['review_count'],
+            neg_weight=df_sentiment['negative_pct'] * df_sentiment['review_count'],
+        ).groupby('bank', sort=False).agg(
+            reviews=('review_count', 'sum'),
+            pos=('pos_weight', 'sum'),
+            neg=('neg_weight', 'sum'),
+        )
+        weighted['positive'] = weighted['pos'] / weighted['reviews']
+        weighted['negative'] = weighted['neg'] / weighted['reviews']
+
+        bank_sentiment = [
+            [row.Index, f"{row.reviews:,}", f"{row.positive:.1f}%", f"{row.negative:.1f}%"]
+            for row in weighted.itertuples()
+        ]
+
         sentiment_summary_data = [['Bank', 'Reviews', 'Positive %', 'Negative %']] + bank_sentiment
-        
-        sentiment_table = Table(sentiment_summary_data, colWidths=[2.5*inch, 1*inch, 1.2*inch, 1.2*inch])
+
+        sentiment_table = Table(sentiment_summary_data,
+                                colWidths=[2.5*inch, 1*inch, 1.2*inch, 1.2*inch],
+                                rowHeights=[0.3*inch] * len(sentiment_summary_data),
+                                splitByRow=0, repeatRows=1)
         sentiment_table.setStyle(TableStyle([
             ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3949ab')),
             ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
@@ -420,15 +559,15 @@ def create_report_pdf(output_file="Interim_Report.pdf"):
         ]))
         story.append(sentiment_table)
         story.append(Spacer(1, 0.15*inch))
-    
+
     # Thematic Analysis
-    story.append(Paragraph("Thematic Analysis", subheading_style))
+    story.append(Paragraph("Thematic Analysis", styles['subheading']))
     theme_text = """
     Thematic analysis identified key topics and concerns across reviews using TF-IDF keyword 
     extraction and rule-based clustering. Reviews were categorized into 7 major themes:
     """
-    story.append(Paragraph(theme_text, normal_style))
-    
+    story.append(Paragraph(theme_text, styles['normal']))
+
     themes_list = [
         "Account Access Issues",
         "Transaction Performance",
@@ -438,28 +577,24 @@ def create_report_pdf(output_file="Interim_Report.pdf"):
         "Security & Privacy",
         "Feature Requests"
     ]
-    
+
     for theme in themes_list:
-        story.append(Paragraph(f"• {theme}", normal_style))
-    
+        story.append(Paragraph(f"• {theme}", styles['normal']))
+
     story.append(Spacer(1, 0.15*inch))
-    
+
     if df_themes is not None:
-        story.append(Paragraph("Identified Themes by Bank", ParagraphStyle(
-            'SmallHeading',
-            parent=normal_style,
-            fontSize=11,
-            fontName='Helvetica-Bold',
-            spaceAfter=8
-        )))
-        
+        story.append(Paragraph("Identified Themes by Bank", styles['small_heading']))
+
         # Count themes per bank
         theme_counts = df_themes.groupby('bank')['theme'].count()
         theme_data = [['Bank', 'Number of Themes']]
         for bank, count in theme_counts.items():
             theme_data.append([bank, str(count)])
-        
-        theme_table = Table(theme_data, colWidths=[4*inch, 2*inch])
+
+        theme_table = Table(theme_data, colWidths=[4*inch, 2*inch],
+                            rowHeights=[0.3*inch] * len(theme_data),
+                            splitByRow=0, repeatRows=1)
         theme_table.setStyle(TableStyle([
             ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3949ab')),
             ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
@@ -473,23 +608,95 @@ def create_report_pdf(output_file="Interim_Report.pdf"):
             ('FONTSIZE', (0, 1), (-1, -1), 9),
         ]))
         story.append(theme_table)
-    
+
     story.append(Spacer(1, 0.15*inch))
-    
+
     # Next Steps
-    story.append(Paragraph("Next Steps", subheading_style))
+    story.append(Paragraph("Next Steps", styles['subheading']))
     next_steps_text = """
     The next phase of analysis will include deeper sentiment analysis by rating category, 
     comprehensive theme extraction with examples, database design for structured storage, 
     and visualization of key insights to support actionable recommendations for each bank.
     """
-    story.append(Paragraph(next_steps_text, normal_style))
+    story.append(Paragraph(next_steps_text, styles['normal']))
+    return story
+
+
+def create_report_pdf(output_file="Interim_Report.pdf", pages=None):
+    """Create the interim report PDF.
+
+    Args:
+        output_file: Path of the PDF to write
+        pages: Optional set of page numbers (1-4) to build; all by default
+    """
+    if pages is None:
+        pages = {1, 2, 3, 4}
+
+    # Load only the data the requested pages actually use
+    sections = []
+    if pages & {2, 3}:
+        sections.append('cleaned')
+    if 4 in pages:
+        sections.extend(['sentiment', 'themes'])
+    data = load_data(tuple(sections))
+    df_cleaned = data['cleaned']
+    df_sentiment = data['sentiment']
+    df_themes = data['themes']
+
+    # Charts and aggregates are cached keyed on the cleaned CSV's
+    # content hash, so reruns on unchanged data skip matplotlib and the
+    # aggregation passes entirely
+    cache_key = _file_hash("data/processed/reviews_cleaned.csv")
+    stats = (_load_report_stats(df_cleaned, cache_key)
+             if df_cleaned is not None else None)
+    charts = _render_charts(stats, cache_key) if stats else {}
+    
+    # Create PDF document
+    doc = SimpleDocTemplate(
+        output_file,
+        pagesize=letter,
+        rightMargin=0.75*inch,
+        leftMargin=0.75*inch,
+        topMargin=0.75*inch,
+        bottomMargin=0.75*inch
+    )
+    
+    # Each page is its own builder returning a flowable list
+    styles = _make_styles()
+    builders = {
+        1: lambda: _build_title_page(styles),
+        2: lambda: _build_summary_page(styles, stats, charts),
+        3: lambda: _build_quality_page(styles, stats, charts),
+        4: lambda: _build_analysis_page(styles, df_sentiment, df_themes),
+    }
+    story = []
+    for page in sorted(pages):
+        story.extend(builders[page]())
+
+    # Don't leave a trailing page break, which would emit a blank page
+    while story and isinstance(story[-1], PageBreak):
+        story.pop()
     
     # Build PDF
     doc.build(story)
     print(f"Report generated successfully: {output_file}")
 
 
-if __name__ == "__main__":
-    create_report_pdf()
+def main():
+    """Parse CLI arguments and generate the report."""
+    parser = argparse.ArgumentParser(description="Generate the interim report PDF")
+    parser.add_argument(
+        '--pages', default='1,2,3,4',
+        help="Comma-separated page numbers to build (e.g. 2,4); default all"
+    )
+    args = parser.parse_args()
 
+    pages = {int(p) for p in args.pages.split(',') if p.strip()}
+    invalid = pages - {1, 2, 3, 4}
+    if invalid:
+        parser.error(f"unknown page number(s): {sorted(invalid)}")
+    create_report_pdf(pages=pages)
+
+
+if __name__ == "__main__":
+    main()
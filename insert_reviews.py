@@ -3,9 +3,12 @@ Insert Cleaned Review Data into PostgreSQL Database
 Reads cleaned reviews CSV and inserts them into the database
 """
 
+import hashlib
+import io
+
 import pandas as pd
 import psycopg2
-from psycopg2.extras import execute_values
+from psycopg2.extras import execute_batch, execute_values
 import os
 from dotenv import load_dotenv
 
@@ -13,6 +16,25 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def _read_csv(path):
+    """Read a CSV with the multi-threaded pyarrow parser when available."""
+    try:
+        return pd.read_csv(path, engine='pyarrow')
+    except (ImportError, ValueError):
+        return pd.read_csv(path)
+
+
+def _read_table(csv_path):
+    """Read a dataset, preferring the Parquet copy next to the CSV."""
+    parquet_path = os.path.splitext(csv_path)[0] + '.parquet'
+    if os.path.exists(parquet_path):
+        try:
+            return pd.read_parquet(parquet_path, engine='pyarrow')
+        except (ImportError, ValueError):
+            pass
+    return _read_csv(csv_path)
+
+
 def get_db_connection():
     """Get database connection."""
     db_params = {
@@ -31,7 +53,7 @@ def get_db_connection():
         return None
 
 
-def get_or_create_bank(conn, bank_name, app_name=None):
+def get_or_create_bank(conn, bank_name, app_name=None, cursor=None):
     """
     Get bank_id for a bank, creating it if it doesn't exist.
     
@@ -39,11 +61,15 @@ def get_or_create_bank(conn, bank_name, app_name=None):
         conn: Database connection
         bank_name: Name of the bank
         app_name: Name of the app (optional)
+        cursor: Optional open cursor; when given, the caller owns the
+            transaction and no commit happens here
     
     Returns:
         bank_id
     """
-    cursor = conn.cursor()
+    own_cursor = cursor is None
+    if own_cursor:
+        cursor = conn.cursor()
     
     # Try to get existing bank
     cursor.execute("SELECT bank_id FROM banks WHERE bank_name = %s", (bank_name,))
@@ -58,10 +84,12 @@ def get_or_create_bank(conn, bank_name, app_name=None):
             (bank_name, app_name or bank_name)
         )
         bank_id = cursor.fetchone()[0]
-        conn.commit()
+        if own_cursor:
+            conn.commit()
         print(f"  Created bank: {bank_name} (ID: {bank_id})")
     
-    cursor.close()
+    if own_cursor:
+        cursor.close()
     return bank_id
 
 
@@ -88,11 +116,11 @@ def insert_reviews_from_csv(csv_file="data/processed/reviews_cleaned.csv",
         # Try to load analyzed reviews first (has sentiment data)
         if os.path.exists(analyzed_file):
             print(f"\nLoading analyzed reviews from {analyzed_file}...")
-            df = pd.read_csv(analyzed_file)
+            df = _read_table(analyzed_file)
             has_sentiment = True
         elif os.path.exists(csv_file):
             print(f"\nLoading cleaned reviews from {csv_file}...")
-            df = pd.read_csv(csv_file)
+            df = _read_table(csv_file)
             has_sentiment = False
             # Add empty sentiment columns if not present
             if 'sentiment_label' not in df.columns:
@@ -144,66 +172,136 @@ def insert_reviews_from_csv(csv_file="data/processed/reviews_cleaned.csv",
         else:
             df['source'] = df['source'].fillna('Google Play Store')
         
-        # Get or create banks and map bank names to IDs
+        # Upsert all banks in one round-trip (bank_name is UNIQUE) and
+        # leave the commit for the end, so banks plus reviews land in a
+        # single transaction with one fsync
         print("\nProcessing banks...")
-        bank_id_map = {}
-        for bank_name in df['bank_name'].unique():
-            bank_id = get_or_create_bank(conn, bank_name)
-            bank_id_map[bank_name] = bank_id
-        
-        # Prepare review data for insertion
-        print("\nPreparing review data...")
-        reviews_data = []
-        
-        for _, row in df.iterrows():
-            bank_id = bank_id_map[row['bank_name']]
-            
-            # Handle date conversion
-            review_date = None
-            if pd.notna(row.get('review_date')) and str(row['review_date']).strip():
-                try:
-                    review_date = pd.to_datetime(row['review_date']).date()
-                except:
-                    review_date = None
-            
-            # Handle sentiment_score conversion
-            sentiment_score = None
-            if pd.notna(row.get('sentiment_score')):
-                try:
-                    sentiment_score = float(row['sentiment_score'])
-                except:
-                    sentiment_score = None
-            
-            reviews_data.append((
-                bank_id,
-                str(row['review_text'])[:10000],  # Limit text length
-                int(row['rating']) if pd.notna(row['rating']) else None,
-                review_date,
-                str(row['sentiment_label']) if pd.notna(row['sentiment_label']) else None,
-                sentiment_score,
-                str(row['source']) if pd.notna(row.get('source')) else 'Google Play Store'
-            ))
-        
-        # Insert reviews in batches
-        print(f"\nInserting {len(reviews_data)} reviews...")
         cursor = conn.cursor()
-        
-        insert_query = """
-            INSERT INTO reviews 
-            (bank_id, review_text, rating, review_date, sentiment_label, sentiment_score, source)
-            VALUES %s
-        """
-        
-        # Use execute_values for batch insertion
-        execute_values(
+        # The whole load runs as one explicit transaction. With
+        # synchronous commit off the final commit skips the WAL fsync
+        # wait, and the bumped work memory speeds up the index updates
+        # after COPY; SET LOCAL scopes all three to this transaction
+        conn.autocommit = False
+        cursor.execute("SET LOCAL synchronous_commit = OFF")
+        cursor.execute("SET LOCAL work_mem = '256MB'")
+        cursor.execute("SET LOCAL maintenance_work_mem = '512MB'")
+        # fetch=True collects RETURNING rows from every page; a bare
+        # fetchall() would only see the final page once the bank list
+        # exceeds execute_values' page_size
+        bank_rows = execute_values(
             cursor,
-            insert_query,
-            reviews_data,
-            page_size=1000
+            "INSERT INTO banks (bank_name, app_name) VALUES %s "
+            "ON CONFLICT (bank_name) DO UPDATE SET app_name = EXCLUDED.app_name "
+            "RETURNING bank_id, bank_name",
+            [(name, name) for name in df['bank_name'].unique()],
+            fetch=True
         )
+        bank_id_map = {name: bank_id for bank_id, name in bank_rows}
+        cursor.close()
         
+        # Prepare review data for insertion: whole columns at a time
+        # instead of iterrows, which boxes every cell per row
+        print("\nPreparing review data...")
+        bank_ids = df['bank_name'].map(bank_id_map).tolist()
+        texts = df['review_text'].astype(str).str.slice(0, 10000).tolist()
+        ratings = pd.to_numeric(df['rating'], errors='coerce')
+        ratings = ratings.astype(object).where(ratings.notna(), None).tolist()
+        # Dates are already normalized to YYYY-MM-DD upstream, so the
+        # explicit format keeps the parse on pandas' fixed-format C path
+        dates = pd.to_datetime(df['review_date'], format='%Y-%m-%d',
+                               errors='coerce')
+        dates = dates.dt.date.astype(object).where(dates.notna(), None).tolist()
+        labels = df['sentiment_label'].astype(object).where(
+            df['sentiment_label'].notna(), None).tolist()
+        scores = pd.to_numeric(df['sentiment_score'], errors='coerce')
+        scores = scores.astype(object).where(scores.notna(), None).tolist()
+        sources = df['source'].astype(str).tolist()
+
+        # Stable content hash per row; the unique index on review_hash
+        # lets the server skip rows that were loaded by a previous run
+        hashes = [
+            hashlib.blake2b((str(bid) + text).encode('utf-8'),
+                            digest_size=16).digest()
+            for bid, text in zip(bank_ids, texts)
+        ]
+
+        reviews_data = list(zip(bank_ids, texts, ratings, dates,
+                                labels, scores, sources, hashes))
+        
+        # Insert reviews via COPY, which bypasses per-row parse/plan;
+        # execute_values stays as the fallback path
+        print(f"\nInserting {len(reviews_data)} reviews...")
+        cursor = conn.cursor()
+
+        copy_df = pd.DataFrame({
+            'bank_id': bank_ids,
+            'review_text': texts,
+            'rating': ratings,
+            'review_date': dates,
+            'sentiment_label': labels,
+            'sentiment_score': scores,
+            'source': sources,
+            # bytea hex input format for COPY
+            'review_hash': ['\\x' + h.hex() for h in hashes],
+        })
+        buf = io.StringIO()
+        copy_df.to_csv(buf, index=False, header=False, na_rep='\\N')
+        buf.seek(0)
+
+        # COPY lands in a temp table first, then moves into reviews with
+        # ON CONFLICT DO NOTHING, so rerunning the script only pays for
+        # rows it has not seen before. The savepoint keeps the banks
+        # upsert and session settings alive if COPY itself fails
+        inserted = None
+        cursor.execute("SAVEPOINT copy_attempt")
+        try:
+            cursor.execute(
+                "CREATE TEMP TABLE reviews_stage "
+                "(LIKE reviews INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+            cursor.copy_expert(
+                "COPY reviews_stage (bank_id, review_text, rating, review_date, "
+                "sentiment_label, sentiment_score, source, review_hash) "
+                "FROM STDIN WITH (FORMAT CSV, NULL '\\N')",
+                buf
+            )
+            cursor.execute(
+                "INSERT INTO reviews "
+                "(bank_id, review_text, rating, review_date, "
+                "sentiment_label, sentiment_score, source, review_hash) "
+                "SELECT bank_id, review_text, rating, review_date, "
+                "sentiment_label, sentiment_score, source, review_hash "
+                "FROM reviews_stage "
+                "ON CONFLICT (review_hash) DO NOTHING"
+            )
+            inserted = cursor.rowcount
+        except psycopg2.Error as e:
+            print(f"  COPY failed ({e}), falling back to batched INSERT...")
+            cursor.execute("ROLLBACK TO SAVEPOINT copy_attempt")
+            # Prepare the INSERT once so the server parses and plans it a
+            # single time instead of re-planning every batch
+            cursor.execute(
+                "PREPARE ins_review AS "
+                "INSERT INTO reviews "
+                "(bank_id, review_text, rating, review_date, sentiment_label, sentiment_score, source, review_hash) "
+                "VALUES ($1, $2, $3, $4, $5, $6, $7, $8) "
+                "ON CONFLICT (review_hash) DO NOTHING"
+            )
+            execute_batch(
+                cursor,
+                "EXECUTE ins_review (%s, %s, %s, %s, %s, %s, %s, %s)",
+                reviews_data,
+                page_size=5000
+            )
+            cursor.execute("DEALLOCATE ins_review")
+
         conn.commit()
-        print(f"[OK] Successfully inserted {len(reviews_data)} reviews")
+        if inserted is not None:
+            skipped = len(reviews_data) - inserted
+            print(f"[OK] Successfully inserted {inserted} reviews"
+                  + (f" ({skipped} already present, skipped)" if skipped else ""))
+        else:
+            print(f"[OK] Successfully processed {len(reviews_data)} reviews")
         
         cursor.close()
         conn.close()
@@ -221,9 +319,85 @@ def insert_reviews_from_csv(csv_file="data/processed/reviews_cleaned.csv",
             conn.close()
 
 
+def update_review_themes(themes_file="data/processed/reviews_with_themes.csv"):
+    """
+    Write computed themes back to the reviews table via COPY.
+    
+    Stages (review_hash, themes) pairs through a temp table with the
+    COPY protocol and applies one batch UPDATE joined on review_hash,
+    instead of issuing a per-row UPDATE round-trip for every review.
+    
+    Args:
+        themes_file: Path to reviews CSV with a themes column
+    """
+    if not os.path.exists(themes_file):
+        return
+    
+    print("\nUpdating review themes...")
+    conn = get_db_connection()
+    if not conn:
+        print("[ERROR] Failed to connect to database.")
+        return
+    
+    try:
+        df = _read_table(themes_file)
+        if 'themes' not in df.columns:
+            print("[ERROR] No themes column found, skipping theme update.")
+            conn.close()
+            return
+        
+        df = df.rename(columns={'review': 'review_text', 'bank': 'bank_name'})
+        
+        cursor = conn.cursor()
+        cursor.execute("SELECT bank_name, bank_id FROM banks")
+        bank_id_map = dict(cursor.fetchall())
+        
+        # Recompute the same content hashes the load path stores, so the
+        # update joins on the indexed review_hash column
+        bank_ids = df['bank_name'].map(bank_id_map).tolist()
+        texts = df['review_text'].astype(str).str.slice(0, 10000).tolist()
+        themes = df['themes'].fillna('').astype(str).tolist()
+        
+        buf = io.StringIO()
+        pd.DataFrame({
+            'review_hash': [
+                '\\x' + hashlib.blake2b((str(bid) + text).encode('utf-8'),
+                                        digest_size=16).hexdigest()
+                for bid, text in zip(bank_ids, texts)
+            ],
+            'themes': themes,
+        }).to_csv(buf, index=False, header=False)
+        buf.seek(0)
+        
+        cursor.execute(
+            "CREATE TEMP TABLE themes_stage "
+            "(review_hash BYTEA, themes TEXT) ON COMMIT DROP"
+        )
+        cursor.copy_expert(
+            "COPY themes_stage (review_hash, themes) "
+            "FROM STDIN WITH (FORMAT CSV)",
+            buf
+        )
+        cursor.execute(
+            "UPDATE reviews r SET themes = s.themes "
+            "FROM themes_stage s WHERE r.review_hash = s.review_hash"
+        )
+        updated = cursor.rowcount
+        conn.commit()
+        cursor.close()
+        conn.close()
+        print(f"[OK] Updated themes for {updated} reviews")
+    except Exception as e:
+        print(f"[ERROR] Error updating themes: {e}")
+        if conn:
+            conn.rollback()
+            conn.close()
+
+
 def main():
     """Main function."""
     insert_reviews_from_csv()
+    update_review_themes()
 
 
 if __name__ == "__main__":
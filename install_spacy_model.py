@@ -3,20 +3,26 @@ Helper script to install spaCy English model
 Run this before using thematic_analysis.py
 """
 
-import subprocess
-import sys
 
 def install_spacy_model():
-    """Install spaCy English model."""
+    """Install spaCy English model, skipping if already present."""
+    import spacy.util
+    from spacy.cli.download import download as spacy_download
+
+    # Skip the download entirely when the model is already installed
+    if spacy.util.is_package("en_core_web_sm"):
+        print("✓ spaCy model (en_core_web_sm) already installed, skipping.")
+        return
+
     print("Installing spaCy English model (en_core_web_sm)...")
     print("This may take a few minutes...")
-    
+
     try:
-        subprocess.check_call([
-            sys.executable, "-m", "spacy", "download", "en_core_web_sm"
-        ])
+        # Calling the download API directly avoids spawning a fresh
+        # interpreter for `python -m spacy download`
+        spacy_download("en_core_web_sm", direct=False)
         print("✓ spaCy model installed successfully!")
-    except subprocess.CalledProcessError as e:
+    except Exception as e:
         print(f"✗ Error installing spaCy model: {str(e)}")
         print("\nYou can try manually:")
         print("  python -m spacy download en_core_web_sm")
@@ -24,5 +30,3 @@ def install_spacy_model():
 
 if __name__ == "__main__":
     install_spacy_model()
-
-
@@ -5,10 +5,28 @@ Cleans and normalizes scraped review data
 
 import pandas as pd
 import numpy as np
-from datetime import datetime
 import os
 
 
+def _optimize_dtypes(df):
+    """
+    Move the hot columns onto compact dtypes after load.
+
+    Arrow-backed strings keep review text and dates in contiguous UTF-8
+    buffers (fast .str ops, less memory); the low-cardinality bank and
+    source columns become categoricals.
+    """
+    try:
+        df = df.astype({'review': 'string[pyarrow]',
+                        'date': 'string[pyarrow]'})
+    except (ImportError, TypeError, KeyError):
+        pass  # pyarrow not installed; object strings still work
+    for col in ('bank', 'source'):
+        if col in df.columns and df[col].dtype != 'category':
+            df[col] = df[col].astype('category')
+    return df
+
+
 def load_raw_data(input_file="data/raw/all_reviews_raw.csv"):
     """
     Load raw review data from CSV.
@@ -19,10 +37,27 @@ def load_raw_data(input_file="data/raw/all_reviews_raw.csv"):
     Returns:
         DataFrame with raw review data
     """
+    # Prefer the Parquet copy written by scrape_reviews.py: typed and
+    # columnar, so no CSV re-parsing on load
+    parquet_file = os.path.splitext(input_file)[0] + '.parquet'
+    if os.path.exists(parquet_file):
+        try:
+            df = pd.read_parquet(parquet_file, engine='pyarrow')
+            print(f"✓ Loaded {len(df)} reviews from {parquet_file}")
+            return _optimize_dtypes(df)
+        except (ImportError, ValueError):
+            pass
+    
     try:
-        df = pd.read_csv(input_file, encoding='utf-8')
+        # Explicit dtypes skip type inference: nullable Int8 is plenty
+        # for a 1-5 rating, and the low-cardinality columns parse
+        # straight into categoricals
+        df = pd.read_csv(input_file, encoding='utf-8',
+                         dtype={'rating': 'Int8',
+                                'bank': 'category',
+                                'source': 'category'})
         print(f"✓ Loaded {len(df)} reviews from {input_file}")
-        return df
+        return _optimize_dtypes(df)
     except FileNotFoundError:
         print(f"✗ Error: File {input_file} not found. Please run scrape_reviews.py first.")
         return None
@@ -42,7 +77,12 @@ def remove_duplicates(df):
         DataFrame with duplicates removed
     """
     initial_count = len(df)
-    df = df.drop_duplicates(subset=['review', 'bank'], keep='first')
+    # Hash (review, bank) to 64-bit keys first so the dedup compares
+    # 8-byte integers instead of full review strings
+    df = (df.assign(_key=pd.util.hash_pandas_object(df[['review', 'bank']],
+                                                    index=False))
+            .drop_duplicates(subset='_key', keep='first')
+            .drop(columns='_key'))
     removed = initial_count - len(df)
     
     if removed > 0:
@@ -63,21 +103,28 @@ def handle_missing_data(df):
     """
     initial_count = len(df)
     
-    # Remove rows where review text is completely missing
-    df = df[df['review'].notna() & (df['review'].str.strip() != '')]
-    
-    # Fill missing ratings with 0 (will be marked for removal if needed)
-    df['rating'] = df['rating'].fillna(0)
-    
-    # Remove rows with invalid ratings (should be 1-5)
-    df = df[(df['rating'] >= 1) & (df['rating'] <= 5)]
-    
-    # Handle missing dates - set to empty string or current date
+    # One fused mask and a single slice: rows need non-empty review text
+    # and a valid 1-5 rating. With the nullable Int8 rating dtype,
+    # between() yields pd.NA for missing ratings, so the NA entries are
+    # forced to False (drop) rather than crashing the boolean indexer.
+    # Chained df[...] filters would copy the frame each time
+    mask = (df['review'].notna()
+            & df['review'].str.strip().ne('')
+            & df['rating'].between(1, 5)).to_numpy(dtype=bool,
+                                                   na_value=False)
+    df = df.loc[mask].copy()
+    
+    # Fill the remaining columns after slicing so the cheap fillna ops
+    # touch only surviving rows; bank/source may be categorical, so the
+    # fill value has to be registered as a category first
     df['date'] = df['date'].fillna('')
-    
-    # Fill missing bank names (shouldn't happen, but just in case)
-    df['bank'] = df['bank'].fillna('Unknown')
-    df['source'] = df['source'].fillna('Google Play Store')
+    for col, default in (('bank', 'Unknown'),
+                         ('source', 'Google Play Store')):
+        if df[col].isna().any():
+            if (isinstance(df[col].dtype, pd.CategoricalDtype)
+                    and default not in df[col].cat.categories):
+                df[col] = df[col].cat.add_categories([default])
+            df[col] = df[col].fillna(default)
     
     removed = initial_count - len(df)
     if removed > 0:
@@ -96,39 +143,39 @@ def normalize_dates(df):
     Returns:
         DataFrame with normalized dates
     """
-    def parse_date(date_str):
-        """Parse various date formats to YYYY-MM-DD."""
-        if pd.isna(date_str) or date_str == '':
-            return ''
-        
-        date_str = str(date_str).strip()
-        
-        # Try different date formats
-        date_formats = [
-            '%Y-%m-%d',
-            '%Y-%m-%d %H:%M:%S',
-            '%d/%m/%Y',
-            '%m/%d/%Y',
-            '%Y/%m/%d',
-            '%d-%m-%Y',
-            '%m-%d-%Y'
-        ]
-        
-        for fmt in date_formats:
-            try:
-                dt = datetime.strptime(date_str, fmt)
-                return dt.strftime('%Y-%m-%d')
-            except:
-                continue
-        
-        # If all formats fail, try pandas parser
-        try:
-            dt = pd.to_datetime(date_str)
-            return dt.strftime('%Y-%m-%d')
-        except:
-            return ''
-    
-    df['date'] = df['date'].apply(parse_date)
+    # Known formats, tried in order; each attempt is one vectorized
+    # parse over the strings still unresolved
+    date_formats = [
+        '%Y-%m-%d',
+        '%Y-%m-%d %H:%M:%S',
+        '%d/%m/%Y',
+        '%m/%d/%Y',
+        '%Y/%m/%d',
+        '%d-%m-%Y',
+        '%m-%d-%Y'
+    ]
+    
+    # Parse each distinct date string once and map the results back,
+    # rather than running the strptime attempts row by row
+    cleaned = df['date'].fillna('').astype(str).str.strip()
+    uniques = pd.Series(pd.unique(cleaned))
+    parsed = pd.Series(pd.NaT, index=uniques.index, dtype='datetime64[ns]')
+    
+    unresolved = parsed.isna() & uniques.ne('')
+    for fmt in date_formats:
+        if not unresolved.any():
+            break
+        parsed.loc[unresolved] = pd.to_datetime(
+            uniques[unresolved], format=fmt, errors='coerce')
+        unresolved = parsed.isna() & uniques.ne('')
+    
+    # Whatever is left goes through the generic pandas parser once
+    if unresolved.any():
+        parsed.loc[unresolved] = pd.to_datetime(
+            uniques[unresolved], errors='coerce')
+    
+    mapping = dict(zip(uniques, parsed.dt.strftime('%Y-%m-%d').fillna('')))
+    df['date'] = cleaned.map(mapping)
     
     # Count successfully parsed dates
     parsed_count = len(df[df['date'] != ''])
@@ -149,12 +196,22 @@ def calculate_data_quality_metrics(df):
     """
     total = len(df)
     
+    # Build all four missing-value masks once and reduce them together,
+    # instead of materializing a filtered frame per metric
+    masks = np.column_stack([
+        (df['review'].isna() | df['review'].str.strip().eq('')).to_numpy(),
+        (df['rating'].isna() | df['rating'].eq(0)).to_numpy(),
+        (df['date'].isna() | df['date'].eq('')).to_numpy(),
+        df['bank'].isna().to_numpy(),
+    ])
+    counts = masks.sum(axis=0)
+    
     metrics = {
         'total_reviews': total,
-        'missing_review_text': len(df[df['review'].isna() | (df['review'].str.strip() == '')]),
-        'missing_rating': len(df[df['rating'].isna() | (df['rating'] == 0)]),
-        'missing_date': len(df[df['date'].isna() | (df['date'] == '')]),
-        'missing_bank': len(df[df['bank'].isna()]),
+        'missing_review_text': int(counts[0]),
+        'missing_rating': int(counts[1]),
+        'missing_date': int(counts[2]),
+        'missing_bank': int(counts[3]),
     }
     
     metrics['missing_data_percentage'] = (
@@ -183,17 +240,12 @@ def main():
     
     print(f"\nInitial dataset: {len(df)} reviews")
     
-    # Remove duplicates
-    df = remove_duplicates(df)
-    
-    # Handle missing data
-    df = handle_missing_data(df)
-    
-    # Normalize dates
-    df = normalize_dates(df)
-    
-    # Ensure correct column order
-    df = df[['review', 'rating', 'date', 'bank', 'source']]
+    # Clean in one chained pass: dedup, drop invalid rows, normalize
+    # dates, and fix the column order without extra intermediates
+    df = (df.pipe(remove_duplicates)
+            .pipe(handle_missing_data)
+            .pipe(normalize_dates)
+            .loc[:, ['review', 'rating', 'date', 'bank', 'source']])
     
     # Calculate quality metrics
     metrics = calculate_data_quality_metrics(df)
@@ -227,14 +279,22 @@ def main():
     output_file = "data/processed/reviews_cleaned.csv"
     df.to_csv(output_file, index=False, encoding='utf-8')
     print(f"\n✓ Saved cleaned data to {output_file}")
+
+    # Also persist a Parquet copy so downstream steps can skip CSV parsing
+    try:
+        parquet_file = "data/processed/reviews_cleaned.parquet"
+        df.to_parquet(parquet_file, engine='pyarrow',
+                      compression='zstd', index=False)
+        print(f"✓ Saved Parquet copy to {parquet_file}")
+    except (ImportError, ValueError):
+        pass  # pyarrow not installed; CSV remains the source of truth
     
     # Print summary by bank
     print("\n" + "=" * 60)
     print("Summary by Bank:")
     print("=" * 60)
-    for bank in df['bank'].unique():
-        bank_df = df[df['bank'] == bank]
-        print(f"  {bank}: {len(bank_df)} reviews")
+    for bank, count in df['bank'].value_counts().items():
+        print(f"  {bank}: {count} reviews")
     print("=" * 60)
 
 
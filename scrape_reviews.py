@@ -4,6 +4,7 @@ Scrapes reviews for three Ethiopian banks: CBE, BOA, and Dashen Bank
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from google_play_scraper import app, reviews, Sort
 import pandas as pd
 from datetime import datetime
@@ -113,28 +114,30 @@ def scrape_app_reviews(app_id, app_name, target_count=400):
 
 def format_reviews(reviews_list, bank_name):
     """
-    Format scraped reviews into a standardized structure.
+    Format scraped reviews into a standardized DataFrame.
     
     Args:
         reviews_list: List of review dictionaries from scraper
         bank_name: Name of the bank
     
     Returns:
-        List of formatted review dictionaries
+        DataFrame with review, rating, date, bank and source columns
     """
-    formatted = []
+    if not reviews_list:
+        return pd.DataFrame(
+            columns=['review', 'rating', 'date', 'bank', 'source'])
     
-    for review in reviews_list:
-        formatted_review = {
-            'review': review.get('content', ''),
-            'rating': review.get('score', 0),
-            'date': review.get('at', '').strftime('%Y-%m-%d') if review.get('at') else '',
-            'bank': bank_name,
-            'source': 'Google Play Store'
-        }
-        formatted.append(formatted_review)
-    
-    return formatted
+    # Whole-column construction: the date formatting runs once over the
+    # datetime column instead of calling strftime per review
+    raw = pd.DataFrame(reviews_list)
+    return pd.DataFrame({
+        'review': raw['content'].fillna(''),
+        'rating': raw['score'].fillna(0),
+        'date': pd.to_datetime(raw['at'], errors='coerce')
+                  .dt.strftime('%Y-%m-%d').fillna(''),
+        'bank': bank_name,
+        'source': 'Google Play Store',
+    })
 
 
 def main():
@@ -143,41 +146,57 @@ def main():
     print("Google Play Store Review Scraper")
     print("=" * 60)
     
-    all_reviews = []
+    # Each bank's scrape is network-bound and rate-limits itself, so the
+    # three run concurrently and their sleep windows overlap
+    results = {}
+    with ThreadPoolExecutor(max_workers=len(BANK_APPS)) as executor:
+        futures = {
+            executor.submit(scrape_app_reviews, app_info['app_id'],
+                            bank_name, app_info['target_reviews']): bank_name
+            for bank_name, app_info in BANK_APPS.items()
+        }
+        for future in as_completed(futures):
+            bank_name = futures[future]
+            results[bank_name] = format_reviews(future.result(), bank_name)
     
-    for bank_name, app_info in BANK_APPS.items():
-        app_id = app_info['app_id']
-        target = app_info['target_reviews']
-        
-        # Scrape reviews
-        raw_reviews = scrape_app_reviews(app_id, bank_name, target)
-        
-        # Format reviews
-        formatted_reviews = format_reviews(raw_reviews, bank_name)
-        all_reviews.extend(formatted_reviews)
+    frames = []
+    
+    for bank_name in BANK_APPS:
+        df_bank = results.get(bank_name)
+        if df_bank is None or df_bank.empty:
+            continue
+        frames.append(df_bank)
         
         # Save raw data for each bank (optional backup)
-        if formatted_reviews:
-            df_bank = pd.DataFrame(formatted_reviews)
-            output_file = f"data/raw/reviews_{bank_name.replace(' ', '_')}_raw.csv"
-            df_bank.to_csv(output_file, index=False, encoding='utf-8')
-            print(f"  Saved raw data to {output_file}")
+        output_file = f"data/raw/reviews_{bank_name.replace(' ', '_')}_raw.csv"
+        df_bank.to_csv(output_file, index=False, encoding='utf-8')
+        print(f"  Saved raw data to {output_file}")
     
     # Save all reviews to a single CSV
-    if all_reviews:
-        df_all = pd.DataFrame(all_reviews)
+    if frames:
+        df_all = pd.concat(frames, ignore_index=True)
         output_file = "data/raw/all_reviews_raw.csv"
         df_all.to_csv(output_file, index=False, encoding='utf-8')
-        print(f"\n✓ Total reviews collected: {len(all_reviews)}")
+        print(f"\n✓ Total reviews collected: {len(df_all)}")
         print(f"✓ Saved all reviews to {output_file}")
         
+        # Parquet copy for downstream steps: typed columnar data loads
+        # without CSV re-parsing
+        try:
+            parquet_file = "data/raw/all_reviews_raw.parquet"
+            df_all.to_parquet(parquet_file, engine='pyarrow',
+                              compression='zstd', index=False)
+            print(f"✓ Saved Parquet copy to {parquet_file}")
+        except (ImportError, ValueError):
+            pass  # pyarrow not installed; CSV remains the source of truth
+        
         # Print summary
         print("\n" + "=" * 60)
         print("Collection Summary:")
         print("=" * 60)
+        bank_counts = df_all['bank'].value_counts()
         for bank_name in BANK_APPS.keys():
-            bank_count = len([r for r in all_reviews if r['bank'] == bank_name])
-            print(f"  {bank_name}: {bank_count} reviews")
+            print(f"  {bank_name}: {bank_counts.get(bank_name, 0)} reviews")
         print("=" * 60)
     else:
         print("\n✗ No reviews were collected. Please check app IDs and try again.")
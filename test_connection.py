@@ -15,12 +15,16 @@ def test_connection():
     print("PostgreSQL Connection Test")
     print("=" * 60)
     
-    # Get connection parameters
+    # Get connection parameters; TCP keepalives detect dead
+    # connections without waiting on long OS timeouts
     db_params = {
         'host': os.getenv('DB_HOST', 'localhost'),
         'port': os.getenv('DB_PORT', '5432'),
         'user': os.getenv('DB_USER', 'postgres'),
         'password': os.getenv('DB_PASSWORD', 'postgres'),
+        'keepalives': 1,
+        'keepalives_idle': 30,
+        'keepalives_interval': 10,
     }
     
     print(f"\nConnection parameters:")
@@ -31,6 +35,7 @@ def test_connection():
     
     # Test 1: Connect to default postgres database
     print("\n[Test 1] Connecting to PostgreSQL server...")
+    conn = None
     try:
         conn = psycopg2.connect(
             database='postgres',  # Connect to default database
@@ -54,7 +59,8 @@ def test_connection():
         if db_exists:
             print("\n[Test 3] Database 'bank_reviews' exists")
             
-            # Test 4: Connect to bank_reviews database
+            # Test 4: Connect to bank_reviews database (Postgres has no
+            # cross-database USE, so one reconnect is unavoidable)
             cursor.close()
             conn.close()
             
@@ -87,8 +93,6 @@ def test_connection():
             print("\n[Test 3] Database 'bank_reviews' does not exist yet")
             print("  Run 'python database_setup.py' to create it")
         
-        conn.close()
-        
         print("\n" + "=" * 60)
         print("Connection test complete!")
         print("=" * 60)
@@ -109,6 +113,10 @@ def test_connection():
         import traceback
         traceback.print_exc()
         return False
+    finally:
+        # Close exactly once, whichever path we took
+        if conn is not None and not conn.closed:
+            conn.close()
 
 
 if __name__ == "__main__":
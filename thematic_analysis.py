@@ -3,29 +3,85 @@ Thematic Analysis Script
 Extracts keywords and groups them into themes for each bank
 """
 
+import multiprocessing
+import os
 import pandas as pd
 import numpy as np
 import re
 from collections import Counter
-from sklearn.feature_extraction.text import TfidfVectorizer
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
 import spacy
 import warnings
 warnings.filterwarnings('ignore')
 
+# POS tags kept during spaCy keyword extraction; set membership beats a
+# list scan per token
+_KEYWORD_POS = {'NOUN', 'ADJ', 'VERB'}
+
+# Compiled once at import; re.sub with a string pattern recompiles (or
+# at least re-checks the pattern cache) on every call
+_URL_RE = re.compile(r'http\S+|www\S+')
+_NONWORD_RE = re.compile(r'[^\w\s]')
+
+# Above this many documents, building a full TF-IDF vocabulary dict
+# over every unique token/bigram dominates memory; switch to a sampled
+# candidate vocabulary instead
+_LARGE_CORPUS_THRESHOLD = 50000
+
+
+@lru_cache(maxsize=1)
+def _get_nlp():
+    """Load the spaCy model once per process, on first use.
+
+    Cached at module level so every analyzer instance in a process
+    shares one loaded model; returns None when the model is missing.
+    """
+    try:
+        print("Loading spaCy model...")
+        # Keyword extraction only needs the tagger (for pos_) and
+        # lemmatizer; dropping the parser and NER roughly halves the
+        # per-token work
+        nlp = spacy.load("en_core_web_sm", disable=["parser", "ner"])
+        print("✓ spaCy model loaded")
+        return nlp
+    except OSError:
+        print("⚠ spaCy model not found. Installing...")
+        print("  Run: python -m spacy download en_core_web_sm")
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _clean_text(text):
+    """Lowercase, strip URLs/punctuation and collapse whitespace.
+
+    Cached because duplicate review texts are common and the same
+    corpus is preprocessed once per extraction pass.
+    """
+    text = text.lower()
+    text = _URL_RE.sub('', text)
+    text = _NONWORD_RE.sub(' ', text)
+    return ' '.join(text.split())
+
 
 class ThematicAnalyzer:
     """Extract themes from reviews using keyword extraction and clustering."""
     
     def __init__(self):
         """Initialize thematic analyzer."""
-        try:
-            print("Loading spaCy model...")
-            self.nlp = spacy.load("en_core_web_sm")
-            print("✓ spaCy model loaded")
-        except OSError:
-            print("⚠ spaCy model not found. Installing...")
-            print("  Run: python -m spacy download en_core_web_sm")
-            self.nlp = None
+        # Compiled keyword alternations per theme set, so repeated
+        # single-review assignments scan each review once per theme
+        self._pattern_cache = {}
+    
+    @property
+    def nlp(self):
+        """spaCy model, loaded lazily on first access.
+        
+        Most runs never leave the TF-IDF path, so the ~200MB model load
+        only happens when the spaCy fallback is actually used.
+        """
+        return _get_nlp()
     
     def preprocess_text(self, text):
         """
@@ -40,15 +96,7 @@ class ThematicAnalyzer:
         if pd.isna(text) or text == '':
             return ''
         
-        text = str(text).lower()
-        # Remove URLs
-        text = re.sub(r'http\S+|www\S+', '', text)
-        # Remove special characters but keep spaces
-        text = re.sub(r'[^\w\s]', ' ', text)
-        # Remove extra whitespace
-        text = ' '.join(text.split())
-        
-        return text
+        return _clean_text(str(text))
     
     def extract_keywords_tfidf(self, texts, max_features=50, ngram_range=(1, 2)):
         """
@@ -62,28 +110,56 @@ class ThematicAnalyzer:
         Returns:
             List of keywords with scores
         """
-        # Preprocess texts
-        processed_texts = [self.preprocess_text(text) for text in texts]
-        
-        # Create TF-IDF vectorizer
-        vectorizer = TfidfVectorizer(
-            max_features=max_features,
-            ngram_range=ngram_range,
-            stop_words='english',
-            min_df=2,  # Word must appear in at least 2 documents
-            max_df=0.8  # Word must appear in less than 80% of documents
-        )
+        # Preprocess the whole corpus column-wise: each .str call runs
+        # one compiled-regex pass over the array instead of a Python
+        # function call with two re.sub's per text
+        s = pd.Series(texts, dtype=object).fillna('').astype(str).str.lower()
+        s = s.str.replace(_URL_RE, '', regex=True)
+        s = s.str.replace(_NONWORD_RE, ' ', regex=True)
+        processed_texts = s.str.split().str.join(' ').tolist()
         
         try:
+            if len(processed_texts) > _LARGE_CORPUS_THRESHOLD:
+                # Pick the candidate terms from every 10th document,
+                # then score only those terms over the full corpus with
+                # a fixed vocabulary. The vectorizer never builds a
+                # corpus-wide vocabulary dict, so peak memory stays
+                # bounded by max_features instead of vocabulary size
+                candidate_vec = CountVectorizer(
+                    max_features=max_features,
+                    ngram_range=ngram_range,
+                    stop_words='english',
+                    min_df=2,
+                    max_df=0.8
+                )
+                candidate_vec.fit(processed_texts[::10])
+                vectorizer = TfidfVectorizer(
+                    vocabulary=candidate_vec.get_feature_names_out(),
+                    ngram_range=ngram_range,
+                    stop_words='english',
+                    dtype=np.float32
+                )
+            else:
+                vectorizer = TfidfVectorizer(
+                    max_features=max_features,
+                    ngram_range=ngram_range,
+                    stop_words='english',
+                    min_df=2,  # Word must appear in at least 2 documents
+                    max_df=0.8,  # Word must appear in less than 80% of documents
+                    dtype=np.float32  # Half the memory; plenty for ranking
+                )
+            
             tfidf_matrix = vectorizer.fit_transform(processed_texts)
             feature_names = vectorizer.get_feature_names_out()
             
-            # Get mean TF-IDF scores
-            mean_scores = np.mean(tfidf_matrix.toarray(), axis=0)
+            # Mean directly on the sparse matrix; .toarray() would
+            # densify n_docs x n_features just to average the columns
+            mean_scores = np.asarray(tfidf_matrix.mean(axis=0)).ravel()
             
-            # Create keyword-score pairs
-            keywords = list(zip(feature_names, mean_scores))
-            keywords.sort(key=lambda x: x[1], reverse=True)
+            # Rank keywords by descending mean score
+            order = np.argsort(mean_scores)[::-1]
+            keywords = [(feature_names[i], float(mean_scores[i]))
+                        for i in order]
             
             return keywords
         except Exception as e:
@@ -104,31 +180,26 @@ class ThematicAnalyzer:
         if not self.nlp:
             return []
         
-        all_keywords = []
+        valid_texts = [str(text) for text in texts
+                       if not (pd.isna(text) or text == '')]
         
-        for text in texts:
-            if pd.isna(text) or text == '':
-                continue
-            
-            doc = self.nlp(str(text))
-            
+        # nlp.pipe streams texts through the pipeline in batches, which
+        # is much faster than calling nlp() once per review. Counting
+        # per doc keeps memory at vocabulary size rather than one list
+        # entry per keyword occurrence
+        keyword_counts = Counter()
+        for doc in self.nlp.pipe(valid_texts, batch_size=256):
             # Extract nouns, adjectives, and verbs (excluding stop words)
-            keywords = [
-                token.lemma_.lower() 
-                for token in doc 
-                if not token.is_stop 
-                and not token.is_punct 
-                and token.pos_ in ['NOUN', 'ADJ', 'VERB']
+            keyword_counts.update(
+                token.lemma_.lower()
+                for token in doc
+                if not token.is_stop
+                and not token.is_punct
+                and token.pos_ in _KEYWORD_POS
                 and len(token.lemma_) > 2
-            ]
-            
-            all_keywords.extend(keywords)
+            )
         
-        # Count frequencies
-        keyword_counts = Counter(all_keywords)
-        top_keywords = keyword_counts.most_common(top_n)
-        
-        return top_keywords
+        return keyword_counts.most_common(top_n)
     
     def identify_themes(self, keywords, bank_name):
         """
@@ -178,32 +249,32 @@ class ThematicAnalyzer:
             ]
         }
         
-        # Convert keywords to lowercase for matching
-        keyword_dict = {kw.lower(): score for kw, score in keywords}
+        # Lowercase the keywords once up front
+        kw_items = [(kw.lower(), score) for kw, score in keywords]
         
-        # Assign keywords to themes
+        # Assign keywords to themes: one pass over the keywords per
+        # theme instead of a patterns x keywords substring loop. The
+        # compiled alternation covers pattern-in-keyword matches, and
+        # the newline-joined pattern string covers keyword-in-pattern
+        # (keywords never contain newlines)
         theme_keywords = {}
         assigned_keywords = set()
         
         for theme, patterns in theme_patterns.items():
-            theme_keywords[theme] = []
+            pat_set = set(patterns)
+            pat_regex = re.compile('|'.join(re.escape(p) for p in patterns))
+            pat_blob = '\n'.join(patterns)
             
-            for pattern in patterns:
-                pattern_lower = pattern.lower()
-                
-                # Check for exact matches
-                if pattern_lower in keyword_dict:
-                    if pattern_lower not in assigned_keywords:
-                        theme_keywords[theme].append((pattern_lower, keyword_dict[pattern_lower]))
-                        assigned_keywords.add(pattern_lower)
-                
-                # Check for partial matches in keywords
-                for kw, score in keywords:
-                    kw_lower = kw.lower()
-                    if pattern_lower in kw_lower or kw_lower in pattern_lower:
-                        if kw_lower not in assigned_keywords:
-                            theme_keywords[theme].append((kw_lower, score))
-                            assigned_keywords.add(kw_lower)
+            matched = []
+            for kw_lower, score in kw_items:
+                if kw_lower in assigned_keywords:
+                    continue
+                if (kw_lower in pat_set
+                        or pat_regex.search(kw_lower)
+                        or kw_lower in pat_blob):
+                    matched.append((kw_lower, score))
+                    assigned_keywords.add(kw_lower)
+            theme_keywords[theme] = matched
         
         # Remove empty themes
         theme_keywords = {k: v for k, v in theme_keywords.items() if v}
@@ -229,91 +300,166 @@ class ThematicAnalyzer:
             return []
         
         review_lower = str(review_text).lower()
-        matched_themes = []
-        
-        for theme, keywords in theme_keywords.items():
-            for keyword, _ in keywords:
-                if keyword in review_lower:
-                    matched_themes.append(theme)
-                    break  # Only need one keyword match per theme
+        matched_themes = [
+            theme
+            for theme, pattern in self._theme_patterns(theme_keywords)
+            if pattern.search(review_lower)
+        ]
         
         return matched_themes if matched_themes else ['Other']
+    
+    def _theme_patterns(self, theme_keywords):
+        """
+        Compile one keyword alternation regex per theme, cached.
+        
+        Each theme gets its own compiled alternation and an independent
+        C-level scan. Themes are deliberately not fused into a single
+        pattern: alternation consumes text, so overlapping keywords
+        from different themes could mask each other, and the vectorized
+        batch path in assign_themes_to_reviews also scans per theme —
+        both paths must label the same text identically.
+        """
+        key = tuple((theme, tuple(kw for kw, _ in kws))
+                    for theme, kws in theme_keywords.items())
+        patterns = self._pattern_cache.get(key)
+        if patterns is None:
+            patterns = [
+                (theme, re.compile('|'.join(re.escape(kw) for kw in kws)))
+                for theme, kws in key if kws
+            ]
+            self._pattern_cache[key] = patterns
+        return patterns
+
 
+# One analyzer per worker process, created lazily on first use so the
+# spaCy model loads once per worker rather than once per bank
+_WORKER_ANALYZER = None
 
-def analyze_themes_by_bank(df):
+
+def _analyze_bank_themes(bank, reviews):
+    """
+    Extract keywords and identify themes for a single bank.
+    
+    Args:
+        bank: Bank name
+        reviews: List of review texts for the bank
+    
+    Returns:
+        Tuple of (bank, keyword_count, themes)
+    """
+    global _WORKER_ANALYZER
+    if _WORKER_ANALYZER is None:
+        _WORKER_ANALYZER = ThematicAnalyzer()
+    analyzer = _WORKER_ANALYZER
+    
+    # Extract keywords using TF-IDF
+    keywords = analyzer.extract_keywords_tfidf(reviews, max_features=100, ngram_range=(1, 2))
+    
+    if not keywords:
+        # Fallback to spaCy if TF-IDF fails
+        keywords = analyzer.extract_keywords_spacy(reviews, top_n=100)
+    
+    themes = analyzer.identify_themes(keywords, bank)
+    return bank, len(keywords), themes
+
+
+def analyze_themes_by_bank(groups):
     """
     Analyze themes for each bank.
     
+    Per-bank keyword extraction is independent CPU-bound work, so the
+    banks run in parallel worker processes; if the pool cannot start,
+    the banks run sequentially in this process instead.
+    
     Args:
-        df: DataFrame with reviews
+        groups: Dictionary mapping bank name to its sub-DataFrame
     
     Returns:
         Dictionary with themes for each bank
     """
-    analyzer = ThematicAnalyzer()
-    bank_themes = {}
+    bank_reviews = [(bank, sub['review'].tolist())
+                    for bank, sub in groups.items()]
     
-    for bank in df['bank'].unique():
-        print(f"\nAnalyzing themes for {bank}...")
-        bank_df = df[df['bank'] == bank]
-        reviews = bank_df['review'].tolist()
-        
-        # Extract keywords using TF-IDF
-        print(f"  Extracting keywords from {len(reviews)} reviews...")
-        keywords = analyzer.extract_keywords_tfidf(reviews, max_features=100, ngram_range=(1, 2))
-        
-        if not keywords:
-            # Fallback to spaCy if TF-IDF fails
-            print("  Trying spaCy keyword extraction...")
-            keywords = analyzer.extract_keywords_spacy(reviews, top_n=100)
-            # Convert to (keyword, score) format
-            keywords = [(kw, freq) for kw, freq in keywords]
-        
-        print(f"  Found {len(keywords)} keywords")
-        
-        # Identify themes
-        print("  Identifying themes...")
-        themes = analyzer.identify_themes(keywords, bank)
-        
+    results = []
+    try:
+        workers = min(len(bank_reviews), os.cpu_count() or 1)
+        ctx = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=ctx) as pool:
+            futures = [pool.submit(_analyze_bank_themes, bank, reviews)
+                       for bank, reviews in bank_reviews]
+            results = [f.result() for f in futures]
+    except Exception as e:
+        print(f"⚠ Parallel analysis unavailable ({e}), running sequentially")
+        results = [_analyze_bank_themes(bank, reviews)
+                   for bank, reviews in bank_reviews]
+    
+    bank_themes = {}
+    for bank, keyword_count, themes in results:
+        print(f"\nAnalyzed themes for {bank}:")
+        print(f"  Found {keyword_count} keywords")
         print(f"  Identified {len(themes)} themes:")
         for theme, theme_kws in themes.items():
             top_kws = [kw for kw, _ in theme_kws[:5]]  # Top 5 keywords
             print(f"    - {theme}: {', '.join(top_kws)}")
-        
-        bank_themes[bank] = {
-            'themes': themes,
-            'analyzer': analyzer
-        }
+        bank_themes[bank] = {'themes': themes}
     
     return bank_themes
 
 
-def assign_themes_to_reviews(df, bank_themes):
+def assign_themes_to_reviews(df, bank_themes, groups=None):
     """
     Assign themes to each review.
     
     Args:
         df: DataFrame with reviews
         bank_themes: Dictionary with themes for each bank
+        groups: Optional dictionary mapping bank name to its
+            sub-DataFrame; grouped once here when not provided
     
     Returns:
         DataFrame with theme assignments
     """
     df = df.copy()
-    df['themes'] = ''
+    
+    # One hash-based grouping pass replaces a full bank-column scan and
+    # boolean mask per bank
+    if groups is None:
+        groups = dict(iter(df.groupby('bank', sort=False)))
+    
+    # Per-bank results accumulate into one positional array, written to
+    # the frame in a single column assignment at the end; banks without
+    # theme data keep the empty default
+    out = np.full(len(df), '', dtype=object)
     
     for bank, theme_data in bank_themes.items():
-        bank_df = df[df['bank'] == bank]
-        analyzer = theme_data['analyzer']
+        if bank not in groups:
+            continue
+        bank_index = groups[bank].index
         themes = theme_data['themes']
         
         print(f"\nAssigning themes to reviews for {bank}...")
         
-        for idx in bank_df.index:
-            review_text = df.loc[idx, 'review']
-            matched_themes = analyzer.assign_theme_to_review(review_text, themes)
-            df.loc[idx, 'themes'] = '; '.join(matched_themes) if matched_themes else 'Other'
+        # One lowercased pass over the bank's reviews, then one compiled
+        # alternation scan per theme, instead of per-row .loc reads and
+        # scalar writes
+        reviews_lower = (df.loc[bank_index, 'review']
+                           .fillna('').astype(str).str.lower())
+        
+        theme_names = np.array(list(themes), dtype=object)
+        masks = np.zeros((len(reviews_lower), len(theme_names)), dtype=bool)
+        for j, theme in enumerate(theme_names):
+            pattern = '|'.join(re.escape(kw) for kw, _ in themes[theme])
+            if pattern:
+                masks[:, j] = reviews_lower.str.contains(
+                    pattern, regex=True).to_numpy()
+        
+        # Unmatched (or empty) reviews fall back to 'Other', as before
+        labels = ['; '.join(theme_names[row]) if row.any() else 'Other'
+                  for row in masks]
+        out[df.index.get_indexer(bank_index)] = labels
     
+    df['themes'] = out
     return df
 
 
@@ -323,16 +469,29 @@ def main():
     df = pd.read_csv("data/processed/reviews_cleaned.csv")
     print(f"Loaded {len(df)} reviews")
     
+    # Group by bank once; both stages reuse the same sub-frames
+    groups = dict(iter(df.groupby('bank', sort=False)))
+    
     # Analyze themes by bank
-    bank_themes = analyze_themes_by_bank(df)
+    bank_themes = analyze_themes_by_bank(groups)
     
     # Assign themes to reviews
-    df_with_themes = assign_themes_to_reviews(df, bank_themes)
+    df_with_themes = assign_themes_to_reviews(df, bank_themes, groups)
     
     # Save results
     df_with_themes.to_csv("data/processed/reviews_with_themes.csv", index=False)
     print(f"\n✓ Saved results to data/processed/reviews_with_themes.csv")
     
+    # Parquet copies let downstream steps skip CSV re-parsing; the CSV
+    # stays the source of truth when pyarrow is unavailable
+    try:
+        df_with_themes.to_parquet(
+            "data/processed/reviews_with_themes.parquet",
+            engine='pyarrow', compression='zstd', index=False)
+        print("✓ Saved Parquet copy to data/processed/reviews_with_themes.parquet")
+    except (ImportError, ValueError):
+        pass
+    
     # Save theme summary
     theme_summary = []
     for bank, theme_data in bank_themes.items():
@@ -348,6 +507,12 @@ def main():
     theme_summary_df = pd.DataFrame(theme_summary)
     theme_summary_df.to_csv("data/processed/theme_summary.csv", index=False)
     print("✓ Saved theme summary to data/processed/theme_summary.csv")
+    try:
+        theme_summary_df.to_parquet(
+            "data/processed/theme_summary.parquet",
+            engine='pyarrow', compression='zstd', index=False)
+    except (ImportError, ValueError):
+        pass
 
 
 if __name__ == "__main__":
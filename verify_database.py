@@ -29,6 +29,60 @@ def get_db_connection():
         return None
 
 
+def _collect_review_stats(cursor):
+    """
+    Gather every single-table rollup over reviews in one scan.
+
+    GROUPING SETS yields the rating distribution, the sentiment
+    distribution and the grand total from a single pass, and the FILTER
+    aggregates ride along on the same scan, replacing five separate
+    sequential scans of reviews.
+
+    Returns:
+        Dictionary with totals, per-column non-null counts, the date
+        range, and the rating/sentiment distributions
+    """
+    # Rollups over a large table parallelize well; scope the setting to
+    # this session
+    cursor.execute("SET max_parallel_workers_per_gather = 4")
+    cursor.execute("""
+        SELECT
+            GROUPING(rating) AS g_rating,
+            GROUPING(sentiment_label) AS g_sentiment,
+            rating,
+            sentiment_label,
+            COUNT(*) AS cnt,
+            COUNT(*) FILTER (WHERE review_text IS NOT NULL) AS has_text,
+            COUNT(*) FILTER (WHERE rating IS NOT NULL) AS has_rating,
+            COUNT(*) FILTER (WHERE review_date IS NOT NULL) AS has_date,
+            COUNT(*) FILTER (WHERE sentiment_label IS NOT NULL) AS has_sentiment,
+            MIN(review_date) AS earliest,
+            MAX(review_date) AS latest
+        FROM reviews
+        GROUP BY GROUPING SETS ((rating), (sentiment_label), ())
+    """)
+
+    stats = {'rating_dist': [], 'sentiment_dist': []}
+    for (g_rating, g_sentiment, rating, sentiment_label, cnt,
+         has_text, has_rating, has_date, has_sentiment,
+         earliest, latest) in cursor.fetchall():
+        if g_rating == 0:
+            if rating is not None:
+                stats['rating_dist'].append((rating, cnt))
+        elif g_sentiment == 0:
+            if sentiment_label is not None:
+                stats['sentiment_dist'].append((sentiment_label, cnt))
+        else:
+            stats.update(total=cnt, has_text=has_text,
+                         has_rating=has_rating, has_date=has_date,
+                         has_sentiment=has_sentiment,
+                         earliest=earliest, latest=latest)
+
+    stats['rating_dist'].sort(key=lambda x: x[0])
+    stats['sentiment_dist'].sort(key=lambda x: x[1], reverse=True)
+    return stats
+
+
 def run_verification_queries():
     """Run verification queries to check data integrity."""
     print("=" * 60)
@@ -40,151 +94,131 @@ def run_verification_queries():
         print("✗ Failed to connect to database.")
         return
     
+    # Pure read workload: a read-only autocommit session takes no row
+    # locks and skips transaction bookkeeping between queries
+    conn.set_session(readonly=True, autocommit=True)
+    
     cursor = conn.cursor()
     
     try:
+        # Queries 1, 4, 5, 6, 7 and 9 all roll up the reviews table;
+        # compute them together from one scan
+        stats = _collect_review_stats(cursor)
+        total_reviews = stats['total']
+        
         # Query 1: Total reviews count
         print("\n[Query 1] Total Reviews Count")
         print("-" * 60)
-        cursor.execute("SELECT COUNT(*) FROM reviews")
-        total_reviews = cursor.fetchone()[0]
         print(f"Total reviews in database: {total_reviews:,}")
         
         # Query 2: Reviews per bank
         print("\n[Query 2] Reviews Count by Bank")
         print("-" * 60)
-        cursor.execute("""
-            SELECT b.bank_name, COUNT(r.review_id) as review_count
-            FROM banks b
-            LEFT JOIN reviews r ON b.bank_id = r.bank_id
-            GROUP BY b.bank_id, b.bank_name
-            ORDER BY review_count DESC
-        """)
-        print(f"{'Bank Name':<40} {'Review Count':>15}")
-        print("-" * 60)
-        for row in cursor.fetchall():
-            print(f"{row[0]:<40} {row[1]:>15,}")
+        # Row-returning queries stream through named (server-side)
+        # cursors: rows arrive in itersize chunks instead of fetchall()
+        # buffering the whole result client-side. withhold keeps the
+        # cursors usable in autocommit mode
+        with conn.cursor(name='verify_q2', withhold=True) as cur:
+            cur.itersize = 2000
+            cur.execute("""
+                SELECT b.bank_name, COUNT(r.review_id) as review_count
+                FROM banks b
+                LEFT JOIN reviews r ON b.bank_id = r.bank_id
+                GROUP BY b.bank_id, b.bank_name
+                ORDER BY review_count DESC
+            """)
+            print(f"{'Bank Name':<40} {'Review Count':>15}")
+            print("-" * 60)
+            for row in cur:
+                print(f"{row[0]:<40} {row[1]:>15,}")
         
         # Query 3: Average rating per bank
         print("\n[Query 3] Average Rating by Bank")
         print("-" * 60)
-        cursor.execute("""
-            SELECT b.bank_name, 
-                   ROUND(AVG(r.rating), 2) as avg_rating,
-                   COUNT(r.review_id) as review_count
-            FROM banks b
-            JOIN reviews r ON b.bank_id = r.bank_id
-            WHERE r.rating IS NOT NULL
-            GROUP BY b.bank_id, b.bank_name
-            ORDER BY avg_rating DESC
-        """)
-        print(f"{'Bank Name':<40} {'Avg Rating':>12} {'Count':>10}")
-        print("-" * 60)
-        for row in cursor.fetchall():
-            print(f"{row[0]:<40} {row[1]:>12} {row[2]:>10,}")
+        with conn.cursor(name='verify_q3', withhold=True) as cur:
+            cur.itersize = 2000
+            cur.execute("""
+                SELECT b.bank_name, 
+                       ROUND(AVG(r.rating), 2) as avg_rating,
+                       COUNT(r.review_id) as review_count
+                FROM banks b
+                JOIN reviews r ON b.bank_id = r.bank_id
+                WHERE r.rating IS NOT NULL
+                GROUP BY b.bank_id, b.bank_name
+                ORDER BY avg_rating DESC
+            """)
+            print(f"{'Bank Name':<40} {'Avg Rating':>12} {'Count':>10}")
+            print("-" * 60)
+            for row in cur:
+                print(f"{row[0]:<40} {row[1]:>12} {row[2]:>10,}")
         
         # Query 4: Rating distribution
         print("\n[Query 4] Rating Distribution")
         print("-" * 60)
-        cursor.execute("""
-            SELECT rating, COUNT(*) as count,
-                   ROUND(COUNT(*) * 100.0 / (SELECT COUNT(*) FROM reviews WHERE rating IS NOT NULL), 2) as percentage
-            FROM reviews
-            WHERE rating IS NOT NULL
-            GROUP BY rating
-            ORDER BY rating
-        """)
         print(f"{'Rating':<10} {'Count':>12} {'Percentage':>12}")
         print("-" * 60)
-        for row in cursor.fetchall():
-            print(f"{row[0]:<10} {row[1]:>12,} {row[2]:>11}%")
+        for rating, count in stats['rating_dist']:
+            pct = round(count * 100.0 / stats['has_rating'], 2)
+            print(f"{rating:<10} {count:>12,} {pct:>11}%")
         
         # Query 5: Sentiment distribution
         print("\n[Query 5] Sentiment Distribution")
         print("-" * 60)
-        cursor.execute("""
-            SELECT sentiment_label, COUNT(*) as count,
-                   ROUND(COUNT(*) * 100.0 / (SELECT COUNT(*) FROM reviews WHERE sentiment_label IS NOT NULL), 2) as percentage
-            FROM reviews
-            WHERE sentiment_label IS NOT NULL
-            GROUP BY sentiment_label
-            ORDER BY count DESC
-        """)
         print(f"{'Sentiment':<15} {'Count':>12} {'Percentage':>12}")
         print("-" * 60)
-        for row in cursor.fetchall():
-            print(f"{row[0]:<15} {row[1]:>12,} {row[2]:>11}%")
+        for label, count in stats['sentiment_dist']:
+            pct = round(count * 100.0 / stats['has_sentiment'], 2)
+            print(f"{label:<15} {count:>12,} {pct:>11}%")
         
         # Query 6: Reviews with sentiment analysis
         print("\n[Query 6] Sentiment Analysis Coverage")
         print("-" * 60)
-        cursor.execute("""
-            SELECT 
-                COUNT(*) as total_reviews,
-                COUNT(sentiment_label) as reviews_with_sentiment,
-                ROUND(COUNT(sentiment_label) * 100.0 / COUNT(*), 2) as coverage_percentage
-            FROM reviews
-        """)
-        row = cursor.fetchone()
-        print(f"Total reviews: {row[0]:,}")
-        print(f"Reviews with sentiment: {row[1]:,}")
-        print(f"Coverage: {row[2]}%")
+        coverage = (round(stats['has_sentiment'] * 100.0 / total_reviews, 2)
+                    if total_reviews else 0)
+        print(f"Total reviews: {total_reviews:,}")
+        print(f"Reviews with sentiment: {stats['has_sentiment']:,}")
+        print(f"Coverage: {coverage}%")
         
         # Query 7: Date range of reviews
         print("\n[Query 7] Review Date Range")
         print("-" * 60)
-        cursor.execute("""
-            SELECT 
-                MIN(review_date) as earliest_review,
-                MAX(review_date) as latest_review,
-                COUNT(*) as reviews_with_dates
-            FROM reviews
-            WHERE review_date IS NOT NULL
-        """)
-        row = cursor.fetchone()
-        if row[0]:
-            print(f"Earliest review: {row[0]}")
-            print(f"Latest review: {row[1]}")
-            print(f"Reviews with dates: {row[2]:,}")
+        if stats['earliest']:
+            print(f"Earliest review: {stats['earliest']}")
+            print(f"Latest review: {stats['latest']}")
+            print(f"Reviews with dates: {stats['has_date']:,}")
         else:
             print("No reviews with dates found")
         
         # Query 8: Average sentiment score by bank
         print("\n[Query 8] Average Sentiment Score by Bank")
         print("-" * 60)
-        cursor.execute("""
-            SELECT b.bank_name,
-                   ROUND(AVG(r.sentiment_score), 4) as avg_sentiment_score,
-                   COUNT(r.review_id) as review_count
-            FROM banks b
-            JOIN reviews r ON b.bank_id = r.bank_id
-            WHERE r.sentiment_score IS NOT NULL
-            GROUP BY b.bank_id, b.bank_name
-            ORDER BY avg_sentiment_score DESC
-        """)
-        print(f"{'Bank Name':<40} {'Avg Score':>12} {'Count':>10}")
-        print("-" * 60)
-        for row in cursor.fetchall():
-            print(f"{row[0]:<40} {row[1]:>12} {row[2]:>10,}")
+        with conn.cursor(name='verify_q8', withhold=True) as cur:
+            cur.itersize = 2000
+            cur.execute("""
+                SELECT b.bank_name,
+                       ROUND(AVG(r.sentiment_score), 4) as avg_sentiment_score,
+                       COUNT(r.review_id) as review_count
+                FROM banks b
+                JOIN reviews r ON b.bank_id = r.bank_id
+                WHERE r.sentiment_score IS NOT NULL
+                GROUP BY b.bank_id, b.bank_name
+                ORDER BY avg_sentiment_score DESC
+            """)
+            print(f"{'Bank Name':<40} {'Avg Score':>12} {'Count':>10}")
+            print("-" * 60)
+            for row in cur:
+                print(f"{row[0]:<40} {row[1]:>12} {row[2]:>10,}")
         
         # Query 9: Data quality check
         print("\n[Query 9] Data Quality Check")
         print("-" * 60)
-        cursor.execute("""
-            SELECT 
-                COUNT(*) as total,
-                COUNT(review_text) as has_text,
-                COUNT(rating) as has_rating,
-                COUNT(review_date) as has_date,
-                COUNT(sentiment_label) as has_sentiment
-            FROM reviews
-        """)
-        row = cursor.fetchone()
-        print(f"Total reviews: {row[0]:,}")
-        print(f"With review text: {row[1]:,} ({row[1]*100/row[0]:.1f}%)")
-        print(f"With rating: {row[2]:,} ({row[2]*100/row[0]:.1f}%)")
-        print(f"With date: {row[3]:,} ({row[3]*100/row[0]:.1f}%)")
-        print(f"With sentiment: {row[4]:,} ({row[4]*100/row[0]:.1f}%)")
+        print(f"Total reviews: {total_reviews:,}")
+        for label, key in (('review text', 'has_text'),
+                           ('rating', 'has_rating'),
+                           ('date', 'has_date'),
+                           ('sentiment', 'has_sentiment')):
+            count = stats[key]
+            print(f"With {label}: {count:,} ({count*100/total_reviews:.1f}%)")
         
         print("\n" + "=" * 60)
         print("Verification Complete!")